@@ -7,22 +7,81 @@ It demonstrates budget management, decision-making, and autonomous payments.
 
 import asyncio
 import os
+from dataclasses import dataclass
 from decimal import Decimal
 from typing import Dict, Any
 
-import aiohttp
+import httpx
+import orjson
+from cachetools import TTLCache
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
-
-from z402 import Z402Client, BudgetManager, CreatePaymentIntentParams, PaymentRequiredError
+from rich.text import Text
+
+try:
+    import uvloop
+except ImportError:  # Optional speedup; not available on Windows
+    uvloop = None
+
+from z402 import (
+    BudgetExceededError,
+    BudgetManager,
+    CreatePaymentIntentParams,
+    PaymentIntent,
+    PaymentRequiredError,
+    Z402Client,
+)
 
 load_dotenv()
 
 console = Console()
 
+# Static panels, built once instead of re-parsing their markup per cycle
+_START_PANEL = Panel.fit(
+    Text.from_markup(
+        "[bold cyan]AI Research Agent[/bold cyan]\n"
+        "Autonomous data acquisition with Z402 budget management"
+    ),
+    title="🤖 Agent Starting",
+)
+_DEMO_PANEL = Panel.fit(
+    Text.from_markup(
+        "[bold]Z402 AI Research Agent Demo[/bold]\n\n"
+        "This agent autonomously pays for premium research data\n"
+        "using Z402 micropayments with budget management."
+    ),
+    title="🤖 Demo 1: AI Research API",
+    border_style="cyan",
+)
+
+@dataclass(slots=True, frozen=True)
+class ResearchTask:
+    """A research endpoint the agent will fetch, with its spending cap"""
+
+    endpoint: str
+    priority: str
+    max_cost: Decimal
+
+# Research priority queue (endpoints to fetch)
+_RESEARCH_QUEUE: tuple[ResearchTask, ...] = (
+    ResearchTask("/api/research/market-trends", "high", Decimal("0.015")),
+    ResearchTask("/api/research/sentiment-analysis", "high", Decimal("0.015")),
+    ResearchTask("/api/research/competitor-analysis", "medium", Decimal("0.01")),
+    ResearchTask("/api/research/predictions", "low", Decimal("0.02")),
+)
+
+# Budget tiers: (minimum share of the daily budget left, priorities still
+# allowed to pay). As the budget depletes, only higher priorities escalate
+# to a paid fetch; the rest are served from the cache or skipped.
+_ESCALATION_TIERS: tuple[tuple[Decimal, frozenset[str]], ...] = (
+    (Decimal("0.5"), frozenset({"high", "medium", "low"})),
+    (Decimal("0.2"), frozenset({"high", "medium"})),
+    (Decimal("0"), frozenset({"high"})),
+)
+
 class AIResearchAgent:
     """
     Autonomous AI agent that pays for research data using Z402.
@@ -39,9 +98,12 @@ class AIResearchAgent:
         api_url: str = "http://localhost:3000",
         daily_budget: str = "0.1",  # 0.1 ZEC per day
         hourly_budget: str = "0.05",  # 0.05 ZEC per hour
+        max_concurrency: int = 4,  # Parallel in-flight research requests
+        cache_ttl: float = 300,  # Seconds a fetched result stays reusable
     ):
         self.api_url = api_url
-        self.session: aiohttp.ClientSession | None = None
+        self.max_concurrency = max_concurrency
+        self.session: httpx.AsyncClient | None = None
 
         # Initialize budget manager
         self.budget = BudgetManager(
@@ -61,25 +123,45 @@ class AIResearchAgent:
         # Track research results
         self.research_results: list[Dict[str, Any]] = []
 
+        # Summary table rows, formatted once as each result arrives
+        self._summary_rows: list[tuple[str, str, str]] = []
+
+        # Recently fetched results by endpoint: (cost paid, data)
+        self._cache: TTLCache[str, tuple[str, Dict[str, Any]]] = TTLCache(
+            maxsize=1024, ttl=cache_ttl
+        )
+
+        # Last quoted price per endpoint, used to pay before the first request
+        self._price_cache: Dict[str, str] = {}
+
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # HTTP/2 lets concurrent fetches multiplex over one pooled connection;
+        # base_url is parsed once, so requests pass only the endpoint path
+        self.session = httpx.AsyncClient(
+            base_url=self.api_url,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(10.0, connect=5.0),
+        )
         await self.z402.__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # The two clients are independent, so close them concurrently
+        closers = [self.z402.__aexit__(exc_type, exc_val, exc_tb)]
         if self.session:
-            await self.session.close()
-        await self.z402.__aexit__(exc_type, exc_val, exc_tb)
+            closers.append(self.session.aclose())
+        await asyncio.gather(*closers)
 
     async def get_available_endpoints(self) -> Dict[str, Any]:
         """Get information about available research endpoints"""
-        async with self.session.get(f"{self.api_url}/api/info") as response:
-            return await response.json()
+        response = await self.session.get("/api/info")
+        return orjson.loads(response.content)
 
     async def fetch_research_data(
         self,
         endpoint: str,
-        max_willing_to_pay: str = "0.02",
+        max_willing_to_pay: Decimal = Decimal("0.02"),
     ) -> Dict[str, Any] | None:
         """
         Fetch research data from a paid endpoint.
@@ -89,115 +171,207 @@ class AIResearchAgent:
         - Cost vs max willing to pay
         - Research priority
         """
-        url = f"{self.api_url}{endpoint}"
-
         console.print(f"\n[cyan]→ Requesting:[/cyan] {endpoint}")
 
+        # Reuse a recent result instead of paying for the same data twice
+        cached = self._get_cached(endpoint)
+        if cached is not None:
+            return cached
+
         try:
-            # Try to access the resource
-            async with self.session.get(url) as response:
-                if response.status == 402:
-                    # Payment required
-                    payment_info = await response.json()
-                    required_amount = payment_info.get("payment", {}).get("amount")
+            # Endpoints with a known price get paid up front, skipping the 402
+            headers = {}
+            prepaid_intent = None
+            known_price = self._price_cache.get(endpoint)
+            if (
+                known_price is not None
+                and Decimal(known_price) <= max_willing_to_pay
+                and await self.budget.can_spend(known_price)
+            ):
+                console.print(f"[green]✓ Known price[/green] - Prepaying {known_price} ZEC...")
+                intent = await self._create_payment_intent(endpoint, known_price)
+                if not await self._record_spend(known_price, intent.id, endpoint):
+                    return None
+                prepaid_intent = intent
+                headers["z402-payment-intent"] = prepaid_intent.id
 
+            # Try to access the resource
+            response = await self.session.get(endpoint, headers=headers)
+            if response.status_code == 200 and prepaid_intent is not None:
+                return self._store_paid_result(endpoint, known_price, prepaid_intent, response)
+
+            if response.status_code == 402:
+                # Payment required (first visit, or the price has changed)
+                payment_info = orjson.loads(response.content)
+                required_amount = payment_info.get("payment", {}).get("amount")
+                self._price_cache[endpoint] = required_amount
+
+                console.print(
+                    f"[yellow]💰 Payment required:[/yellow] {required_amount} ZEC"
+                )
+
+                # Decision-making: Is it worth paying?
+                if Decimal(required_amount) > max_willing_to_pay:
                     console.print(
-                        f"[yellow]💰 Payment required:[/yellow] {required_amount} ZEC"
+                        f"[red]✗ Cost too high[/red] (max: {max_willing_to_pay} ZEC)"
                     )
+                    return None
 
-                    # Decision-making: Is it worth paying?
-                    if Decimal(required_amount) > Decimal(max_willing_to_pay):
-                        console.print(
-                            f"[red]✗ Cost too high[/red] (max: {max_willing_to_pay} ZEC)"
-                        )
-                        return None
-
-                    # Check budget
-                    if not await self.budget.can_spend(required_amount):
-                        stats = await self.budget.get_statistics()
-                        console.print(
-                            f"[red]✗ Budget exceeded[/red] "
-                            f"(spent: {stats['daily_spent']}/{stats['daily_limit']} ZEC)"
-                        )
-                        return None
-
-                    # Agent approves payment
-                    console.print(f"[green]✓ Approved[/green] - Paying {required_amount} ZEC...")
-
-                    # Create payment intent
-                    intent = await self.z402.payments.create(
-                        CreatePaymentIntentParams(
-                            amount=required_amount,
-                            resource=endpoint,
-                            metadata={"agent": "research-bot", "endpoint": endpoint},
-                        )
+                # Check budget
+                if not await self.budget.can_spend(required_amount):
+                    stats = await self.budget.get_statistics()
+                    console.print(
+                        f"[red]✗ Budget exceeded[/red] "
+                        f"(spent: {stats['daily_spent']}/{stats['daily_limit']} ZEC)"
                     )
+                    return None
 
-                    console.print(f"[dim]Payment intent: {intent.id}[/dim]")
+                # Agent approves payment
+                console.print(f"[green]✓ Approved[/green] - Paying {required_amount} ZEC...")
 
-                    # In production, agent would:
-                    # 1. Send Zcash to intent.zcash_address
-                    # 2. Get transaction ID
-                    # 3. Submit payment with tx ID
+                intent = await self._create_payment_intent(endpoint, required_amount)
 
-                    # For demo, we'll simulate by using the payment intent ID
-                    # In reality, the endpoint would verify the actual blockchain transaction
+                # Record spend in budget before paying
+                if not await self._record_spend(required_amount, intent.id, endpoint):
+                    return None
 
-                    # Record spend in budget
-                    await self.budget.record_spend(
-                        required_amount,
-                        intent.id,
-                        metadata={"endpoint": endpoint},
+                # Retry with payment intent header (simulated payment proof)
+                headers = {"z402-payment-intent": intent.id}
+                paid_response = await self.session.get(endpoint, headers=headers)
+                if paid_response.status_code == 200:
+                    return self._store_paid_result(
+                        endpoint, required_amount, intent, paid_response
                     )
-
-                    # Retry with payment intent header (simulated payment proof)
-                    headers = {"z402-payment-intent": intent.id}
-                    async with self.session.get(url, headers=headers) as paid_response:
-                        if paid_response.status == 200:
-                            data = await paid_response.json()
-                            console.print(
-                                f"[green]✓ Data received[/green] ({len(str(data))} bytes)"
-                            )
-
-                            # Store result
-                            self.research_results.append({
-                                "endpoint": endpoint,
-                                "cost": required_amount,
-                                "timestamp": intent.created_at,
-                                "data": data,
-                            })
-
-                            return data
-                        else:
-                            console.print(
-                                f"[red]✗ Payment verification failed[/red] ({paid_response.status})"
-                            )
-                            return None
-
-                elif response.status == 200:
-                    # Free resource
-                    data = await response.json()
-                    console.print(f"[green]✓ Free data received[/green]")
-                    return data
-
                 else:
-                    console.print(f"[red]✗ Error {response.status}[/red]")
+                    console.print(
+                        f"[red]✗ Payment verification failed[/red] ({paid_response.status_code})"
+                    )
                     return None
 
+            elif response.status_code == 200:
+                # Free resource
+                data = orjson.loads(response.content)
+                console.print(f"[green]✓ Free data received[/green]")
+                self._cache[endpoint] = ("0", data)
+                return data
+
+            else:
+                console.print(f"[red]✗ Error {response.status_code}[/red]")
+                return None
+
         except Exception as e:
             console.print(f"[red]✗ Error:[/red] {str(e)}")
             return None
 
-    async def run_research_cycle(self):
-        """Run a complete research cycle, fetching data from multiple endpoints"""
-        console.print(
-            Panel.fit(
-                "[bold cyan]AI Research Agent[/bold cyan]\n"
-                "Autonomous data acquisition with Z402 budget management",
-                title="🤖 Agent Starting",
+    async def route_task(self, item: ResearchTask) -> Dict[str, Any] | None:
+        """
+        Fetch a research task through the cheapest path its priority allows.
+
+        Priorities outside the current budget tier never trigger a payment:
+        they are answered from the cache when possible and skipped otherwise.
+        """
+        remaining = await self.budget.get_remaining_daily()
+        share_left = remaining / self.budget.daily_limit
+
+        allowed = next(
+            priorities
+            for min_share, priorities in _ESCALATION_TIERS
+            if share_left >= min_share
+        )
+        if item.priority in allowed:
+            return await self.fetch_research_data(item.endpoint, item.max_cost)
+
+        console.print(f"\n[cyan]→ Cache only ({item.priority}):[/cyan] {item.endpoint}")
+        cached = self._get_cached(item.endpoint)
+        if cached is None:
+            console.print(
+                f"[yellow]⤼ Skipped[/yellow] - {remaining} ZEC left, "
+                f"reserved for higher priorities"
+            )
+        return cached
+
+    async def _record_spend(self, amount: str, transaction_id: str, endpoint: str) -> bool:
+        """
+        Record a spend in the budget before paying for it.
+
+        can_spend() alone isn't enough once fetches run concurrently: every
+        task could pass the check before any of them records. record_spend()
+        checks the limits and records the spend in one call, raising when it
+        doesn't fit, so over-budget spends are refused before any payment.
+        """
+        try:
+            await self.budget.record_spend(
+                amount, transaction_id, metadata={"endpoint": endpoint}
+            )
+        except BudgetExceededError:
+            stats = await self.budget.get_statistics()
+            console.print(
+                f"[red]✗ Budget exceeded[/red] "
+                f"(spent: {stats['daily_spent']}/{stats['daily_limit']} ZEC)"
+            )
+            return False
+        return True
+
+    def _get_cached(self, endpoint: str) -> Dict[str, Any] | None:
+        """Return a recently fetched result for an endpoint, if any"""
+        cached = self._cache.get(endpoint)
+        if cached is None:
+            return None
+
+        cost, data = cached
+        console.print(f"[green]✓ Cache hit[/green] - saved {cost} ZEC")
+        return data
+
+    async def _create_payment_intent(self, endpoint: str, amount: str) -> PaymentIntent:
+        """Create the payment intent used as proof of payment for an endpoint"""
+        intent = await self.z402.payments.create(
+            CreatePaymentIntentParams(
+                amount=amount,
+                resource=endpoint,
+                metadata={"agent": "research-bot", "endpoint": endpoint},
             )
         )
 
+        console.print(f"[dim]Payment intent: {intent.id}[/dim]")
+
+        # In production, agent would:
+        # 1. Send Zcash to intent.zcash_address
+        # 2. Get transaction ID
+        # 3. Submit payment with tx ID
+
+        # For demo, we'll simulate by using the payment intent ID
+        # In reality, the endpoint would verify the actual blockchain transaction
+
+        return intent
+
+    def _store_paid_result(
+        self,
+        endpoint: str,
+        cost: str,
+        intent: PaymentIntent,
+        response: httpx.Response,
+    ) -> Dict[str, Any]:
+        """Record paid research data and make it reusable from the cache"""
+        # Size comes from the raw body; no need to re-stringify the parsed data
+        body = response.content
+        data = orjson.loads(body)
+        console.print(f"[green]✓ Data received[/green] ({len(body)} bytes)")
+
+        self.research_results.append({
+            "endpoint": endpoint,
+            "cost": cost,
+            "timestamp": intent.created_at,
+            "data": data,
+        })
+        self._summary_rows.append((endpoint, f"{cost} ZEC", "✓ Success"))
+        self._cache[endpoint] = (cost, data)
+
+        return data
+
+    async def run_research_cycle(self):
+        """Run a complete research cycle, fetching data from multiple endpoints"""
+        console.print(_START_PANEL)
+
         # Show initial budget
         stats = await self.budget.get_statistics()
         console.print(
@@ -208,42 +382,26 @@ class AIResearchAgent:
         info = await self.get_available_endpoints()
         console.print(f"\n[cyan]Available endpoints:[/cyan] {len(info['endpoints'])}")
 
-        # Research priority queue (endpoints to fetch)
-        research_queue = [
-            {
-                "endpoint": "/api/research/market-trends",
-                "priority": "high",
-                "max_cost": "0.015",
-            },
-            {
-                "endpoint": "/api/research/sentiment-analysis",
-                "priority": "high",
-                "max_cost": "0.015",
-            },
-            {
-                "endpoint": "/api/research/competitor-analysis",
-                "priority": "medium",
-                "max_cost": "0.01",
-            },
-            {
-                "endpoint": "/api/research/predictions",
-                "priority": "low",
-                "max_cost": "0.02",
-            },
-        ]
-
         # Execute research
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
         ) as progress:
-            task = progress.add_task("[cyan]Fetching research data...", total=len(research_queue))
+            task = progress.add_task(
+                "[cyan]Fetching research data...", total=len(_RESEARCH_QUEUE)
+            )
+
+            # Fetches are independent, so run them concurrently (bounded)
+            semaphore = asyncio.Semaphore(self.max_concurrency)
 
-            for item in research_queue:
-                await self.fetch_research_data(item["endpoint"], item["max_cost"])
+            async def fetch_bounded(item: ResearchTask) -> Dict[str, Any] | None:
+                async with semaphore:
+                    data = await self.route_task(item)
                 progress.update(task, advance=1)
-                await asyncio.sleep(0.5)  # Rate limiting
+                return data
+
+            await asyncio.gather(*(fetch_bounded(item) for item in _RESEARCH_QUEUE))
 
         # Show results summary
         await self.show_summary()
@@ -260,12 +418,8 @@ class AIResearchAgent:
         table.add_column("Cost", style="green", justify="right")
         table.add_column("Status", style="yellow")
 
-        for result in self.research_results:
-            table.add_row(
-                result["endpoint"],
-                f"{result['cost']} ZEC",
-                "✓ Success",
-            )
+        for row in self._summary_rows:
+            table.add_row(*row)
 
         console.print(table)
 
@@ -299,15 +453,7 @@ class AIResearchAgent:
 
 async def main():
     """Main entry point"""
-    console.print(
-        Panel.fit(
-            "[bold]Z402 AI Research Agent Demo[/bold]\n\n"
-            "This agent autonomously pays for premium research data\n"
-            "using Z402 micropayments with budget management.",
-            title="🤖 Demo 1: AI Research API",
-            border_style="cyan",
-        )
-    )
+    console.print(_DEMO_PANEL)
 
     # Check environment
     if not os.getenv("Z402_API_KEY"):
@@ -326,7 +472,8 @@ async def main():
     console.print("\n[green]✓ Agent completed successfully[/green]")
 
 if __name__ == "__main__":
+    run = uvloop.run if uvloop else asyncio.run
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         console.print("\n[yellow]Agent stopped by user[/yellow]")
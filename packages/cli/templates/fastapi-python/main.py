@@ -1,7 +1,16 @@
-from fastapi import FastAPI, Header, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi import Depends, FastAPI, Header, HTTPException, Request
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
+from cachetools import TTLCache
 from z402 import Z402
+import asyncio
+import atexit
+import json
+import logging
+import logging.handlers
+import orjson
 import os
+import queue
+import time
 from dotenv import load_dotenv
 from datetime import datetime
 from typing import Optional
@@ -11,42 +20,78 @@ load_dotenv()
 app = FastAPI(
     title="{{PROJECT_NAME}}",
     description="A Z402-integrated FastAPI application",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse
 )
 
+# Environment is fixed for the life of the process, so read it once
+_NETWORK = os.getenv("Z402_NETWORK", "testnet")
+_NODE_ENV = os.getenv("NODE_ENV")
+
 # Initialize Z402
 z402 = Z402(
     api_key=os.getenv("Z402_API_KEY"),
-    network=os.getenv("Z402_NETWORK", "testnet")
+    network=_NETWORK
 )
 
+# Handlers only enqueue log records; a background thread does the writing,
+# so stdout IO stays off the request path
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger("z402.webhooks")
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# Formatted UTC timestamp and the time it was taken, refreshed at most
+# twice a second so hot endpoints don't format a datetime per request
+_ts_cache = ["", 0.0]
+
+
+def _iso_now() -> str:
+    """Current UTC time in ISO format, at sub-second granularity"""
+    now = time.time()
+    if now - _ts_cache[1] > 0.5:
+        _ts_cache[0] = datetime.utcfromtimestamp(now).isoformat()
+        _ts_cache[1] = now
+    return _ts_cache[0]
+
+
+# The root payload never changes after startup, so encode it only once
+_ROOT_BODY = orjson.dumps({
+    "message": "Z402-integrated API",
+    "version": "0.1.0",
+    "docs": "/docs",
+    "network": _NETWORK
+})
+
 
 @app.get("/")
 async def root():
     """Public endpoint - no payment required"""
-    return {
-        "message": "Z402-integrated API",
-        "version": "0.1.0",
-        "docs": "/docs",
-        "network": os.getenv("Z402_NETWORK", "testnet")
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {
-        "status": "ok",
-        "timestamp": datetime.utcnow().isoformat()
-    }
+    body = b'{"status":"ok","timestamp":"' + _iso_now().encode() + b'"}'
+    return Response(content=body, media_type="application/json")
 
 
-@app.get("/api/premium")
-async def premium_content(
-    authorization: Optional[str] = Header(None),
-    request: Request = None
-):
-    """Protected endpoint - requires payment"""
+# Payment tokens that verified recently; repeat requests with the same token
+# skip the verification round trip until the entry expires
+_verified_tokens = TTLCache(maxsize=10_000, ttl=60)
+
+
+async def verified_payment(
+    request: Request,
+    authorization: Optional[str] = Header(None)
+) -> str:
+    """Dependency that requires a valid payment authorization"""
 
     # Check if payment authorization is provided
     if not authorization:
@@ -65,6 +110,9 @@ async def premium_content(
             }
         )
 
+    if authorization in _verified_tokens:
+        return authorization
+
     # Verify payment
     is_valid = await z402.verify_payment(authorization)
 
@@ -77,13 +125,21 @@ async def premium_content(
             }
         )
 
+    _verified_tokens[authorization] = True
+    return authorization
+
+
+@app.get("/api/premium", dependencies=[Depends(verified_payment)])
+async def premium_content():
+    """Protected endpoint - requires payment"""
+
     # Payment verified - return premium content
     return {
         "message": "Premium content unlocked!",
         "data": {
             "secret": "This is exclusive premium content",
             "value": "Only paid users can see this",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _iso_now()
         }
     }
 
@@ -96,9 +152,8 @@ async def webhook_handler(
     """Handle Z402 webhook events"""
 
     try:
-        event = await request.json()
-
-        print(f"Webhook received: {event.get('type')}")
+        # Raw bytes are what was signed; parse only after verifying them
+        body = await request.body()
 
         # Verify signature
         if not x_z402_signature:
@@ -107,7 +162,11 @@ async def webhook_handler(
                 detail="Missing signature"
             )
 
-        is_valid = z402.verify_webhook(event, x_z402_signature)
+        # HMAC over a large body would stall every other request, so run
+        # it in a worker thread instead of on the event loop
+        is_valid = await asyncio.to_thread(
+            z402.verify_webhook, body, x_z402_signature
+        )
 
         if not is_valid:
             raise HTTPException(
@@ -115,33 +174,36 @@ async def webhook_handler(
                 detail="Invalid signature"
             )
 
+        event = json.loads(body)
+
         # Handle different event types
         event_type = event.get("type")
+        logger.info("Webhook received: %s", event_type)
 
         if event_type == "payment.created":
-            print(f"Payment created: {event['data']['id']}")
+            logger.info("Payment created: %s", event["data"]["id"])
 
         elif event_type == "payment.verified":
-            print(f"Payment verified: {event['data']['id']}")
+            logger.info("Payment verified: %s", event["data"]["id"])
             # Grant access to content
 
         elif event_type == "payment.settled":
-            print(f"Payment settled: {event['data']['id']}")
+            logger.info("Payment settled: %s", event["data"]["id"])
 
         elif event_type == "payment.failed":
-            print(f"Payment failed: {event['data']['id']}")
+            logger.info("Payment failed: %s", event["data"]["id"])
 
         elif event_type == "payment.refunded":
-            print(f"Payment refunded: {event['data']['id']}")
+            logger.info("Payment refunded: %s", event["data"]["id"])
             # Revoke access
 
         else:
-            print(f"Unhandled event type: {event_type}")
+            logger.info("Unhandled event type: %s", event_type)
 
         return {"received": True}
 
     except Exception as e:
-        print(f"Webhook error: {str(e)}")
+        logger.error("Webhook error: %s", e)
         raise HTTPException(
             status_code=500,
             detail="Webhook processing failed"
@@ -155,7 +217,7 @@ async def global_exception_handler(request: Request, exc: Exception):
         status_code=500,
         content={
             "error": "Internal server error",
-            "message": str(exc) if os.getenv("NODE_ENV") == "development" else None
+            "message": str(exc) if _NODE_ENV == "development" else None
         }
     )
 
@@ -166,15 +228,20 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", 3000))
 
     print(f"Starting server on http://localhost:{port}")
-    print(f"Environment: {os.getenv('NODE_ENV', 'development')}")
-    print(f"Network: {os.getenv('Z402_NETWORK', 'testnet')}")
+    print(f"Environment: {_NODE_ENV or 'development'}")
+    print(f"Network: {_NETWORK}")
     print(f"Protected endpoint: http://localhost:{port}/api/premium")
     print(f"Webhook endpoint: http://localhost:{port}/webhooks/z402")
     print(f"API docs: http://localhost:{port}/docs")
 
+    # httptools parser + long keep-alive so clients reuse their connections;
+    # loop="auto" picks uvloop where uvicorn[standard] installed it
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=port,
-        reload=os.getenv("NODE_ENV") != "production"
+        http="httptools",
+        loop="auto",
+        timeout_keep_alive=75,
+        reload=_NODE_ENV != "production"
     )
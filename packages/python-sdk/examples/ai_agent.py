@@ -3,15 +3,24 @@ AI Research Agent Example
 
 Demonstrates how an AI agent can autonomously manage payments for API access
 using Z402 SDK with budget management.
+
+Requires extra client packages: pip install "httpx[http2,brotli]" orjson
+Install uvloop as well for a faster event loop (optional, not on Windows).
 """
 
 import asyncio
 import os
 from decimal import Decimal
 
-import aiohttp
+import httpx
+import orjson
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # Optional speedup; not available on Windows
+    uvloop = None
+
 from z402 import (
     BudgetManager,
     CreatePaymentIntentParams,
@@ -57,17 +66,24 @@ class AIResearchAgent:
         )
 
         self.wallet_address = os.getenv("ZCASH_ADDRESS", "zs1...")
-        self.session: aiohttp.ClientSession | None = None
+        self.session: httpx.AsyncClient | None = None
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # HTTP/2 lets repeated requests multiplex over one pooled connection
+        self.session = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(10.0, connect=5.0),
+        )
         await self.z402.__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        # The two clients are independent, so close them concurrently
+        closers = [self.z402.__aexit__(exc_type, exc_val, exc_tb)]
         if self.session:
-            await self.session.close()
-        await self.z402.__aexit__(exc_type, exc_val, exc_tb)
+            closers.append(self.session.aclose())
+        await asyncio.gather(*closers)
 
     async def fetch_data(self, endpoint: str, max_cost: str = "0.01") -> dict:
         """
@@ -89,9 +105,9 @@ class AIResearchAgent:
             # Try to access resource
             response = await self.session.get(endpoint)
 
-            if response.status == 402:
+            if response.status_code == 402:
                 # Payment required
-                payment_info = await response.json()
+                payment_info = orjson.loads(response.content)
                 required_amount = payment_info.get("payment", {}).get("amount")
                 resource = payment_info.get("payment", {}).get("resource")
 
@@ -118,23 +134,23 @@ class AIResearchAgent:
                     headers={"z402-payment-intent": payment.id},
                 )
 
-                if response.status == 200:
+                if response.status_code == 200:
                     print(f"[Agent] Payment successful! Accessing resource...")
                     await self.budget.record_spend(
                         required_amount,
                         payment.id,
                         metadata={"endpoint": endpoint},
                     )
-                    return await response.json()
+                    return orjson.loads(response.content)
 
-            elif response.status == 200:
+            elif response.status_code == 200:
                 # Free resource
                 print("[Agent] Resource is free")
-                return await response.json()
+                return orjson.loads(response.content)
 
             else:
-                print(f"[Agent] Error: {response.status}")
-                return {"error": f"HTTP {response.status}"}
+                print(f"[Agent] Error: {response.status_code}")
+                return {"error": f"HTTP {response.status_code}"}
 
         except PaymentRequiredError as e:
             print(f"[Agent] Payment required: {e.amount} ZEC for {e.resource}")
@@ -227,4 +243,5 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run = uvloop.run if uvloop else asyncio.run
+    run(main())
@@ -6,6 +6,8 @@ Demonstrates basic SDK functionality for common use cases.
 
 import asyncio
 import os
+import sys
+from typing import List
 
 from dotenv import load_dotenv
 
@@ -23,174 +25,200 @@ from z402 import (
 
 load_dotenv()
 
+# Read once; examples that need the API are skipped when it isn't set
+API_KEY = os.getenv("Z402_API_KEY")
 
-async def example_create_payment():
-    """Create a payment intent"""
-    print("\n" + "=" * 60)
-    print("Example: Create Payment Intent")
-    print("=" * 60)
 
-    async with Z402Client(
-        api_key=os.getenv("Z402_API_KEY", ""),
-        network="testnet"
-    ) as client:
-        # Create payment intent
-        intent = await client.payments.create(
-            CreatePaymentIntentParams(
-                amount="0.01",
-                resource="/api/premium/data",
-                metadata={"user_id": "123", "plan": "premium"},
-            )
+def _emit(lines: List[str]) -> None:
+    """Write an example's output in one call so concurrent examples don't interleave"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+async def example_create_payment(client: Z402Client):
+    """Create a payment intent"""
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("Example: Create Payment Intent")
+    out.append("=" * 60)
+
+    # Create payment intent
+    intent = await client.payments.create(
+        CreatePaymentIntentParams(
+            amount="0.01",
+            resource="/api/premium/data",
+            metadata={"user_id": "123", "plan": "premium"},
         )
+    )
+
+    out.append(f"Payment Intent Created:")
+    out.append(f"  ID: {intent.id}")
+    out.append(f"  Amount: {intent.amount} ZEC")
+    out.append(f"  Status: {intent.status}")
+    out.append(f"  Pay to: {intent.zcash_address}")
+    out.append(f"  Expires: {intent.expires_at}")
+
+    _emit(out)
+
+
+async def example_create_payments_batch(client: Z402Client):
+    """Create several payment intents concurrently"""
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("Example: Create Payment Intents in Batch")
+    out.append("=" * 60)
+
+    # Independent intents don't need to wait on each other: create_many
+    # issues the requests in parallel (at most 10 at a time), so the batch
+    # takes about as long as the slowest request rather than their sum
+    intents = await client.payments.create_many(
+        CreatePaymentIntentParams(amount="0.01", resource=f"/api/premium/item/{i}")
+        for i in range(5)
+    )
 
-        print(f"Payment Intent Created:")
-        print(f"  ID: {intent.id}")
-        print(f"  Amount: {intent.amount} ZEC")
-        print(f"  Status: {intent.status.value}")
-        print(f"  Pay to: {intent.zcash_address}")
-        print(f"  Expires: {intent.expires_at}")
+    out.append(f"Created {len(intents)} payment intents:")
+    for intent in intents:
+        out.append(f"  {intent.id}: {intent.amount} ZEC for {intent.resource}")
 
+    _emit(out)
 
-async def example_verify_payment():
+
+async def example_verify_payment(client: Z402Client):
     """Verify a payment"""
-    print("\n" + "=" * 60)
-    print("Example: Verify Payment")
-    print("=" * 60)
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("Example: Verify Payment")
+    out.append("=" * 60)
+
+    # First create a payment
+    intent = await client.payments.create(
+        CreatePaymentIntentParams(amount="0.01", resource="/api/data")
+    )
 
-    async with Z402Client(
-        api_key=os.getenv("Z402_API_KEY", ""),
-        network="testnet"
-    ) as client:
-        # First create a payment
-        intent = await client.payments.create(
-            CreatePaymentIntentParams(amount="0.01", resource="/api/data")
-        )
+    out.append(f"Created payment: {intent.id}")
 
-        print(f"Created payment: {intent.id}")
+    # Verify payment status
+    verified = await client.payments.verify(intent.id)
+    out.append(f"Payment status: {verified.status}")
 
-        # Verify payment status
-        verified = await client.payments.verify(intent.id)
-        print(f"Payment status: {verified.status.value}")
+    if verified.status == PaymentStatus.SETTLED:
+        out.append("✓ Payment settled - grant access to resource")
+    else:
+        out.append("✗ Payment not yet settled")
 
-        if verified.status == PaymentStatus.SETTLED:
-            print("✓ Payment settled - grant access to resource")
-        else:
-            print("✗ Payment not yet settled")
+    _emit(out)
 
 
-async def example_list_transactions():
+async def example_list_transactions(client: Z402Client):
     """List transactions with filtering"""
-    print("\n" + "=" * 60)
-    print("Example: List Transactions")
-    print("=" * 60)
-
-    async with Z402Client(
-        api_key=os.getenv("Z402_API_KEY", ""),
-        network="testnet"
-    ) as client:
-        # List recent settled transactions
-        response = await client.transactions.list(
-            ListTransactionsParams(
-                limit=10,
-                status=TransactionStatus.SETTLED,
-                date_from="2025-01-01",
-            )
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("Example: List Transactions")
+    out.append("=" * 60)
+
+    # List recent settled transactions
+    response = await client.transactions.list(
+        ListTransactionsParams(
+            limit=10,
+            status=TransactionStatus.SETTLED,
+            date_from="2025-01-01",
         )
+    )
 
-        print(f"Total transactions: {response.total}")
-        print(f"Showing: {len(response.transactions)}")
-        print(f"Has more: {response.has_more}")
+    out.append(f"Total transactions: {response.total}")
+    out.append(f"Showing: {len(response.transactions)}")
+    out.append(f"Has more: {response.has_more}")
 
-        for tx in response.transactions:
-            print(f"\n  {tx.id}")
-            print(f"  Amount: {tx.amount} {tx.currency}")
-            print(f"  Status: {tx.status.value}")
-            print(f"  Resource: {tx.resource_url}")
+    for tx in response.transactions:
+        out.append(f"\n  {tx.id}")
+        out.append(f"  Amount: {tx.amount} {tx.currency}")
+        out.append(f"  Status: {tx.status}")
+        out.append(f"  Resource: {tx.resource_url}")
 
+    _emit(out)
 
-async def example_refund():
+
+async def example_refund(client: Z402Client):
     """Refund a transaction"""
-    print("\n" + "=" * 60)
-    print("Example: Refund Transaction")
-    print("=" * 60)
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("Example: Refund Transaction")
+    out.append("=" * 60)
 
-    async with Z402Client(
-        api_key=os.getenv("Z402_API_KEY", ""),
-        network="testnet"
-    ) as client:
-        # Get a transaction (you'd have a real transaction ID)
-        # For demo, we'll just show the API call
-        print("To refund a transaction:")
-        print("  tx = await client.transactions.refund(")
-        print("      'tx_123...',")
-        print("      RefundParams(reason='Customer requested refund')")
-        print("  )")
+    # Get a transaction (you'd have a real transaction ID)
+    # For demo, we'll just show the API call
+    out.append("To refund a transaction:")
+    out.append("  tx = await client.transactions.refund(")
+    out.append("      'tx_123...',")
+    out.append("      RefundParams(reason='Customer requested refund')")
+    out.append("  )")
 
+    _emit(out)
 
-async def example_export_transactions():
-    """Export transactions to CSV"""
-    print("\n" + "=" * 60)
-    print("Example: Export Transactions")
-    print("=" * 60)
 
-    async with Z402Client(
-        api_key=os.getenv("Z402_API_KEY", ""),
-        network="testnet"
-    ) as client:
-        # Export to CSV
-        csv_data = await client.transactions.export_csv(
+async def example_export_transactions(client: Z402Client):
+    """Export transactions to CSV"""
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("Example: Export Transactions")
+    out.append("=" * 60)
+
+    # Stream the CSV straight to disk so memory use doesn't grow with
+    # the size of the export
+    size = 0
+    with open("transactions.csv", "wb") as f:
+        async for chunk in client.transactions.export_csv_stream(
             ListTransactionsParams(
                 date_from="2025-01-01",
                 date_to="2025-01-31",
             )
-        )
+        ):
+            f.write(chunk)
+            size += len(chunk)
 
-        print(f"CSV Export: {len(csv_data)} characters")
-        print("First 200 chars:")
-        print(csv_data[:200])
+    out.append(f"CSV Export: {size} bytes written to transactions.csv")
 
-        # Could save to file:
-        # with open("transactions.csv", "w") as f:
-        #     f.write(csv_data)
+    # For small exports, export_csv returns the whole file as a string:
+    # csv_data = await client.transactions.export_csv(params)
 
+    _emit(out)
 
-async def example_webhook_management():
-    """Manage webhooks"""
-    print("\n" + "=" * 60)
-    print("Example: Webhook Management")
-    print("=" * 60)
 
-    async with Z402Client(
-        api_key=os.getenv("Z402_API_KEY", ""),
-        network="testnet"
-    ) as client:
-        # Update webhook
-        config = await client.webhooks.update(
-            UpdateWebhookParams(
-                webhook_url="https://example.com/webhooks/z402",
-                events=["payment.settled", "payment.failed"],
-            )
+async def example_webhook_management(client: Z402Client):
+    """Manage webhooks"""
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("Example: Webhook Management")
+    out.append("=" * 60)
+
+    # Update webhook
+    config = await client.webhooks.update(
+        UpdateWebhookParams(
+            webhook_url="https://example.com/webhooks/z402",
+            events=["payment.settled", "payment.failed"],
         )
+    )
+
+    out.append(f"Webhook configured:")
+    out.append(f"  URL: {config.url}")
+    out.append(f"  Events: {', '.join(config.events)}")
+    out.append(f"  Secret: {config.secret[:10]}...")
 
-        print(f"Webhook configured:")
-        print(f"  URL: {config.url}")
-        print(f"  Events: {', '.join(config.events)}")
-        print(f"  Secret: {config.secret[:10]}...")
+    _emit(out)
 
 
 def example_verify_webhook_signature():
     """Verify webhook signature"""
-    print("\n" + "=" * 60)
-    print("Example: Verify Webhook Signature")
-    print("=" * 60)
-
-    # Example webhook payload
-    payload = {
-        "id": "evt_123",
-        "type": "payment.settled",
-        "data": {"id": "tx_123", "amount": "0.01"},
-        "createdAt": "2025-01-01T00:00:00Z",
-    }
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("Example: Verify Webhook Signature")
+    out.append("=" * 60)
+
+    # Example webhook payload. Verify the exact bytes received in the request
+    # body (e.g. `await request.body()`), not a parsed or re-serialized dict
+    payload = (
+        b'{"id":"evt_123","type":"payment.settled",'
+        b'"data":{"id":"tx_123","amount":"0.01"},"createdAt":"2025-01-01T00:00:00Z"}'
+    )
 
     # Example signature (would come from webhook header)
     signature = "t=1234567890,v1=abc123..."
@@ -200,18 +228,21 @@ def example_verify_webhook_signature():
 
     try:
         event = verify_webhook(payload, signature, secret)
-        print(f"✓ Webhook verified")
-        print(f"  Event type: {event['type']}")
-        print(f"  Event ID: {event['id']}")
+        out.append(f"✓ Webhook verified")
+        out.append(f"  Event type: {event['type']}")
+        out.append(f"  Event ID: {event['id']}")
     except Exception as e:
-        print(f"✗ Verification failed: {str(e)}")
+        out.append(f"✗ Verification failed: {str(e)}")
+
+    _emit(out)
 
 
 async def example_budget_management():
     """Budget management for AI agents"""
-    print("\n" + "=" * 60)
-    print("Example: Budget Management")
-    print("=" * 60)
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("Example: Budget Management")
+    out.append("=" * 60)
 
     # Create budget manager
     budget = BudgetManager(
@@ -222,31 +253,39 @@ async def example_budget_management():
 
     # Check if can spend
     can_spend = await budget.can_spend("0.02")
-    print(f"Can spend 0.02 ZEC: {can_spend}")
+    out.append(f"Can spend 0.02 ZEC: {can_spend}")
 
     # Record spending
     await budget.record_spend("0.02", "tx_123", metadata={"purpose": "API access"})
-    print("Recorded spend: 0.02 ZEC")
+    out.append("Recorded spend: 0.02 ZEC")
 
     # Get statistics
     stats = await budget.get_statistics()
-    print(f"\nBudget Statistics:")
-    print(f"  Daily limit: {stats['daily_limit']} ZEC")
-    print(f"  Daily spent: {stats['daily_spent']} ZEC")
-    print(f"  Daily remaining: {stats['daily_remaining']} ZEC")
-    print(f"  Usage: {stats['daily_usage_percent']:.1f}%")
+    out.append(f"\nBudget Statistics:")
+    out.append(f"  Daily limit: {stats['daily_limit']} ZEC")
+    out.append(f"  Daily spent: {stats['daily_spent']} ZEC")
+    out.append(f"  Daily remaining: {stats['daily_remaining']} ZEC")
+    out.append(f"  Usage: {stats['daily_usage_percent']:.1f}%")
+
+    _emit(out)
 
 
 async def example_with_budget():
     """Using Z402Client with budget manager"""
-    print("\n" + "=" * 60)
-    print("Example: Client with Budget Manager")
-    print("=" * 60)
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("Example: Client with Budget Manager")
+    out.append("=" * 60)
+
+    if not API_KEY:
+        out.append("Skipped: Z402_API_KEY not set")
+        _emit(out)
+        return
 
     budget = BudgetManager(daily_limit="1.0")
 
     async with Z402Client(
-        api_key=os.getenv("Z402_API_KEY", ""),
+        api_key=API_KEY,
         network="testnet",
         budget_manager=budget,
     ) as client:
@@ -261,23 +300,30 @@ async def example_with_budget():
         # Get budget stats
         if client.budget:
             stats = await client.budget.get_statistics()
-            print(f"Budget usage: {stats['daily_usage_percent']:.1f}%")
+            out.append(f"Budget usage: {stats['daily_usage_percent']:.1f}%")
+
+    _emit(out)
 
 
 async def main():
     """Run all examples"""
-    api_key = os.getenv("Z402_API_KEY")
-    if not api_key:
+    if not API_KEY:
         print("Warning: Z402_API_KEY not set. Some examples will be skipped.")
         print("Set it with: export Z402_API_KEY=z402_test_...")
 
     # Run examples
-    if api_key:
-        await example_create_payment()
-        await example_verify_payment()
-        await example_list_transactions()
-        await example_export_transactions()
-        await example_webhook_management()
+    if API_KEY:
+        # The network examples don't depend on each other, so run them
+        # concurrently over one shared client and connection pool
+        async with Z402Client(api_key=API_KEY, network="testnet") as client:
+            await asyncio.gather(
+                example_create_payment(client),
+                example_create_payments_batch(client),
+                example_verify_payment(client),
+                example_list_transactions(client),
+                example_export_transactions(client),
+                example_webhook_management(client),
+            )
 
     # These work without API key
     example_verify_webhook_signature()
@@ -7,7 +7,8 @@ API access and premium tool usage.
 
 import asyncio
 import os
-from typing import Optional
+import threading
+from typing import Any, Coroutine, Optional
 
 from dotenv import load_dotenv
 
@@ -24,6 +25,38 @@ from z402 import BudgetManager, CreatePaymentIntentParams, Z402Client
 
 load_dotenv()
 
+# Sync tool calls are dispatched to one long-lived loop on a daemon thread
+# instead of paying for a fresh asyncio.run() loop on every invocation
+_BG_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_BG_LOOP_LOCK = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Get the shared background event loop, starting it on first use"""
+    global _BG_LOOP
+    with _BG_LOOP_LOCK:
+        if _BG_LOOP is None:
+            _BG_LOOP = asyncio.new_event_loop()
+            threading.Thread(
+                target=_BG_LOOP.run_forever, name="z402-tools", daemon=True
+            ).start()
+    return _BG_LOOP
+
+
+def _run_sync(coro: Coroutine[Any, Any, str]) -> str:
+    """Run a tool coroutine to completion from synchronous code"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run_coroutine_threadsafe(coro, _background_loop()).result()
+
+    # Blocking here would stall the caller's event loop until the tool finishes
+    coro.close()
+    raise RuntimeError(
+        "Sync tool call made from inside a running event loop; "
+        "await the tool's async interface (_arun / ainvoke) instead"
+    )
+
 
 class PremiumDataTool(BaseTool):
     """
@@ -80,8 +113,8 @@ class PremiumDataTool(BaseTool):
             return f"Error accessing premium data: {str(e)}"
 
     def _run(self, query: str) -> str:
-        """Sync implementation (runs async version)"""
-        return asyncio.run(self._arun(query))
+        """Sync implementation (runs async version on the background loop)"""
+        return _run_sync(self._arun(query))
 
 
 class BudgetAwareLangChainAgent:
@@ -137,7 +170,8 @@ class BudgetAwareLangChainAgent:
         print(f"Budget Status: {stats['daily_spent']}/{stats['daily_limit']} ZEC spent")
         print(f"Remaining: {remaining} ZEC")
 
-        if float(remaining) < 0.01:
+        # Compare in zatoshis (0.01 ZEC = 1_000_000 zat) to skip parsing the string
+        if stats["daily_remaining_zat"] < 1_000_000:
             return "Error: Insufficient budget to run task"
 
         # In production, this would run the LangChain agent
@@ -205,10 +239,13 @@ def create_z402_tools(z402_client: Z402Client) -> list:
         description = "Access paid APIs with automatic payment handling"
         z402 = z402_client
 
-        def _run(self, endpoint: str) -> str:
+        async def _arun(self, endpoint: str) -> str:
             # Implementation here
             return f"Would access {endpoint} with payment"
 
+        def _run(self, endpoint: str) -> str:
+            return _run_sync(self._arun(endpoint))
+
     tools.append(PaidAPITool())
 
     return tools
@@ -0,0 +1,76 @@
+"""Tests for BudgetManager"""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from z402.exceptions import BudgetExceededError
+from z402.utils.budget import BudgetManager
+
+
+async def test_reserve_holds_the_whole_batch():
+    budget = BudgetManager(daily_limit="1.0")
+
+    reservations = await budget.reserve(["0.3", "0.4"])
+
+    assert [r.amount for r in reservations] == ["0.3", "0.4"]
+    assert await budget.get_daily_spent() == Decimal("0.7")
+    assert not await budget.can_spend("0.31")
+
+
+async def test_reserve_rejects_batch_over_limit():
+    budget = BudgetManager(daily_limit="1.0", hourly_limit="0.5")
+
+    with pytest.raises(BudgetExceededError):
+        await budget.reserve(["0.3", "0.3"])
+
+    # Nothing is held after a rejected batch
+    assert await budget.get_hourly_spent() == Decimal("0")
+
+
+async def test_reserve_checks_transaction_limit_per_item():
+    budget = BudgetManager(daily_limit="1.0", transaction_limit="0.1")
+
+    with pytest.raises(BudgetExceededError):
+        await budget.reserve(["0.05", "0.2"])
+
+
+async def test_release_returns_budget():
+    budget = BudgetManager(daily_limit="1.0", hourly_limit="1.0")
+    first, second = await budget.reserve(["0.3", "0.4"])
+
+    await first.release()
+    await first.release()
+
+    assert await budget.get_daily_spent() == Decimal("0.4")
+    assert await budget.get_hourly_spent() == Decimal("0.4")
+
+    await second.record("tx-2")
+    assert [t["transaction_id"] for t in await budget.get_transaction_history()] == ["tx-2"]
+
+    # A recorded reservation keeps its spend
+    await second.release()
+    assert await budget.get_daily_spent() == Decimal("0.4")
+
+
+async def test_concurrent_reservations_never_overspend():
+    budget = BudgetManager(daily_limit="1.0")
+
+    results = await asyncio.gather(
+        *(budget.reserve(["0.2", "0.2"]) for _ in range(5)),
+        return_exceptions=True,
+    )
+
+    accepted = [r for r in results if not isinstance(r, BaseException)]
+    assert len(accepted) == 2
+    assert all(isinstance(r, BudgetExceededError) for r in results if r not in accepted)
+    assert await budget.get_daily_spent() == Decimal("0.8")
+
+
+async def test_record_spend_sees_reservations():
+    budget = BudgetManager(daily_limit="1.0")
+    await budget.reserve(["0.9"])
+
+    with pytest.raises(BudgetExceededError):
+        await budget.record_spend("0.2", "tx-1")
@@ -0,0 +1,88 @@
+"""Tests for Z402Client"""
+
+import asyncio
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("pydantic")
+
+from z402.client import Z402Client  # noqa: E402
+from z402.utils.budget import BudgetManager  # noqa: E402
+
+
+class FakePayments:
+    """Payments resource that answers without the network"""
+
+    def __init__(self, fail_resources=()):
+        self.fail_resources = set(fail_resources)
+        self.paid = []
+        self._count = 0
+
+    async def create(self, params):
+        await asyncio.sleep(0)
+        self._count += 1
+        return SimpleNamespace(id=f"pi_{self._count}", resource=params.resource)
+
+    async def pay(self, payment_id, params):
+        await asyncio.sleep(0)
+        if payment_id in self.fail_resources:
+            raise RuntimeError("payment failed")
+        self.paid.append(payment_id)
+        return SimpleNamespace(id=payment_id)
+
+
+def make_client(budget, payments):
+    client = Z402Client(api_key="z402_test", budget_manager=budget)
+    client.payments = payments
+    return client
+
+
+def items(*amounts):
+    return [
+        {"amount": amount, "resource": f"/api/{i}", "from_address": "zs1", "tx_id": f"tx{i}"}
+        for i, amount in enumerate(amounts)
+    ]
+
+
+async def test_pay_many_records_each_payment():
+    budget = BudgetManager(daily_limit="1.0")
+    client = make_client(budget, FakePayments())
+
+    paid = await client.pay_many(items("0.1", "0.2"))
+
+    assert len(paid) == 2
+    assert await budget.get_daily_spent() == Decimal("0.3")
+    assert len(await budget.get_transaction_history()) == 2
+
+
+async def test_concurrent_pay_many_stays_within_budget():
+    budget = BudgetManager(daily_limit="1.0")
+    payments = FakePayments()
+    client = make_client(budget, payments)
+
+    # Each call fits on its own, but only two batches and the single payment
+    # fit together
+    results = await asyncio.gather(
+        *(client.pay_many(items("0.2", "0.2")) for _ in range(4)),
+        client.pay(amount="0.2", resource="/api/x", from_address="zs1", tx_id="tx"),
+        return_exceptions=True,
+    )
+
+    rejected = [r for r in results if isinstance(r, ValueError)]
+    assert len(rejected) == 2
+    assert len(payments.paid) == 5
+    assert await budget.get_daily_spent() == Decimal("1.0")
+
+
+async def test_pay_many_releases_failed_payments():
+    budget = BudgetManager(daily_limit="1.0")
+    client = make_client(budget, FakePayments(fail_resources={"pi_2"}))
+
+    with pytest.raises(RuntimeError):
+        await client.pay_many(items("0.3", "0.4"), concurrency=1)
+
+    assert await budget.get_daily_spent() == Decimal("0.3")
+    assert [t["transaction_id"] for t in await budget.get_transaction_history()] == ["pi_1"]
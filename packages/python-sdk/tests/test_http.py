@@ -0,0 +1,123 @@
+"""Tests for AsyncHTTPClient's shared GETs"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from z402.utils.http import AsyncHTTPClient  # noqa: E402
+
+
+class Counter:
+    """GET stand-in that counts calls and waits until released"""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        return {"call": self.calls}
+
+
+def make_client(cache_ttl=0):
+    return AsyncHTTPClient(api_key="z402_test", base_url="https://api.test", cache_ttl=cache_ttl)
+
+
+async def test_concurrent_identical_gets_share_one_request():
+    client = make_client()
+    fetch = Counter()
+
+    calls = [
+        asyncio.ensure_future(client._shared_get(False, "/transactions", {"limit": 10}, fetch))
+        for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    fetch.release.set()
+
+    assert await asyncio.gather(*calls) == [{"call": 1}] * 5
+    assert fetch.calls == 1
+    assert not client._inflight
+
+
+async def test_different_queries_are_not_shared():
+    client = make_client()
+    fetch = Counter()
+    fetch.release.set()
+
+    await asyncio.gather(
+        client._shared_get(False, "/transactions", {"limit": 10}, fetch),
+        client._shared_get(False, "/transactions", {"limit": 20}, fetch),
+        client._shared_get(True, "/transactions", {"limit": 10}, fetch),
+    )
+
+    assert fetch.calls == 3
+
+
+async def test_cancelled_caller_does_not_cancel_shared_request():
+    client = make_client()
+    fetch = Counter()
+
+    first = asyncio.ensure_future(client._shared_get(False, "/payments", None, fetch))
+    second = asyncio.ensure_future(client._shared_get(False, "/payments", None, fetch))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    fetch.release.set()
+
+    assert await second == {"call": 1}
+    assert fetch.calls == 1
+
+
+async def test_without_ttl_results_are_not_cached():
+    client = make_client()
+    fetch = Counter()
+    fetch.release.set()
+
+    await client._shared_get(False, "/payments", None, fetch)
+    await client._shared_get(False, "/payments", None, fetch)
+
+    assert fetch.calls == 2
+
+
+async def test_ttl_cache_serves_repeat_gets():
+    client = make_client(cache_ttl=60)
+    fetch = Counter()
+    fetch.release.set()
+
+    assert await client._shared_get(False, "/payments/pi_1", None, fetch) == {"call": 1}
+    assert await client._shared_get(False, "/payments/pi_1", None, fetch) == {"call": 1}
+    assert fetch.calls == 1
+
+
+async def test_invalidate_drops_path_and_paths_beneath_it():
+    client = make_client(cache_ttl=60)
+    fetch = Counter()
+    fetch.release.set()
+
+    for path in ("/transactions", "/transactions/tx_1", "/transactions-export", "/payments"):
+        await client._shared_get(False, path, None, fetch)
+
+    client.invalidate("/transactions")
+
+    assert sorted(key[1] for key in client._cache) == ["/payments", "/transactions-export"]
+
+    client.invalidate()
+    assert not client._cache
+
+
+async def test_invalidate_during_fetch_skips_caching_stale_result():
+    client = make_client(cache_ttl=60)
+    fetch = Counter()
+
+    call = asyncio.ensure_future(client._shared_get(False, "/webhooks", None, fetch))
+    while not fetch.calls:
+        await asyncio.sleep(0)
+    client.invalidate("/webhooks")
+    fetch.release.set()
+
+    assert await call == {"call": 1}
+    assert not client._cache
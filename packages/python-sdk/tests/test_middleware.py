@@ -0,0 +1,125 @@
+"""Tests for the payment verification middleware helpers"""
+
+import asyncio
+
+import pytest
+
+from z402 import middleware
+
+
+def test_verified_cache_returns_copies():
+    key = ("https://api.test", "z402_key", "pi_1")
+    payment_intent = {"id": "pi_1", "status": "settled"}
+
+    middleware._put_cached(key, payment_intent, ttl=60)
+    payment_intent["status"] = "failed"
+
+    cached = middleware._get_cached(key)
+    assert cached == {"id": "pi_1", "status": "settled"}
+
+    cached["status"] = "failed"
+    assert middleware._get_cached(key)["status"] == "settled"
+
+
+def test_verified_cache_skips_unsettled():
+    key = ("https://api.test", "z402_key", "pi_2")
+
+    middleware._put_cached(key, {"id": "pi_2", "status": "pending"}, ttl=60)
+
+    assert middleware._get_cached(key) is None
+
+
+class FakeResponse:
+    def __init__(self, status_code, retry_after=None):
+        self.status_code = status_code
+        self.content = b"{}"
+        self.headers = {"retry-after": retry_after} if retry_after else {}
+
+
+class FakeClient:
+    """httpx-style client answering with a fixed sequence of statuses"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def get(self, url, headers):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+async def test_limiter_halves_on_429_and_recovers():
+    limiter = middleware._VerifyLimiter(max_limit=16, min_limit=4, increase_after=3)
+
+    limiter.record(429)
+    assert limiter.limit == 8
+    limiter.record(429)
+    limiter.record(429)
+    assert limiter.limit == 4
+
+    for _ in range(3):
+        limiter.record(200)
+    assert limiter.limit == 5
+
+    # A 429 restarts the run of successes
+    limiter.record(200)
+    limiter.record(429)
+    limiter.record(200)
+    limiter.record(200)
+    assert limiter.limit == 4
+
+
+async def test_limiter_wakes_waiters_when_limit_rises():
+    limiter = middleware._VerifyLimiter(max_limit=2, min_limit=1, increase_after=1)
+    limiter.record(429)
+
+    await limiter.acquire()
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.record(200)
+    await asyncio.sleep(0)
+    assert waiter.done()
+
+    limiter.release()
+    limiter.release()
+
+
+async def test_fetch_retries_once_after_429(monkeypatch):
+    monkeypatch.setattr(middleware, "_retry_after_delay", lambda value: 0.0)
+    client = FakeClient(FakeResponse(429, retry_after="1"), FakeResponse(200))
+
+    status, _ = await middleware._fetch(client, "https://api.test/pi_1", {})
+
+    assert status == 200
+    assert client.calls == 2
+
+
+async def test_fetch_returns_second_429(monkeypatch):
+    monkeypatch.setattr(middleware, "_retry_after_delay", lambda value: 0.0)
+    client = FakeClient(FakeResponse(429), FakeResponse(429))
+
+    status, _ = await middleware._fetch(client, "https://api.test/pi_1", {})
+
+    assert status == 429
+    assert client.calls == 2
+
+
+async def test_middleware_close_closes_shared_session():
+    pytest.importorskip("fastapi")
+
+    session = await middleware._get_shared_session()
+    z402 = middleware.Z402Middleware(
+        object(),
+        api_key="z402_key",
+        protected_paths=["/api/premium"],
+        amount="0.01",
+        resource="/api/premium",
+    )
+
+    await z402.close()
+
+    assert session.closed
+    assert await middleware._get_shared_session() is not session
+    await middleware.close_shared_session()
@@ -0,0 +1,49 @@
+"""Tests for the SDK models"""
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from z402.models import Transaction, WebhookEvent  # noqa: E402
+
+TRANSACTION = {
+    "id": "tx_1",
+    "merchantId": "m_1",
+    "amount": "0.01",
+    "status": "settled",
+    "paymentIntentId": "pi_1",
+    "resourceUrl": "/api/data",
+    "toAddress": "zs1",
+    "createdAt": "2025-01-01T00:00:00Z",
+    "updatedAt": "2025-01-01T00:00:00Z",
+}
+
+
+def test_webhook_event_keeps_raw_payload():
+    event = WebhookEvent.model_validate(
+        {
+            "id": "evt_1",
+            "type": "payment.settled",
+            "data": {"id": "partial"},
+            "createdAt": "2025-01-01T00:00:00Z",
+        }
+    )
+
+    # Routing on the event never validates its payload
+    assert event.type == "payment.settled"
+    assert event.payload == {"id": "partial"}
+
+
+def test_webhook_event_data_is_a_transaction():
+    event = WebhookEvent.model_validate(
+        {
+            "id": "evt_1",
+            "type": "payment.settled",
+            "data": TRANSACTION,
+            "createdAt": "2025-01-01T00:00:00Z",
+        }
+    )
+
+    assert isinstance(event.data, Transaction)
+    assert event.data.payment_intent_id == "pi_1"
+    assert event.data is event.data
@@ -0,0 +1,82 @@
+"""Tests for TransactionsResource"""
+
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from z402.models.transaction import ListTransactionsParams  # noqa: E402
+from z402.resources.transactions import TransactionsResource  # noqa: E402
+
+
+def transaction(i):
+    return {
+        "id": f"tx_{i}",
+        "merchantId": "m_1",
+        "amount": "0.01",
+        "status": "settled",
+        "paymentIntentId": f"pi_{i}",
+        "resourceUrl": "/api/data",
+        "toAddress": "zs1",
+        "createdAt": "2025-01-01T00:00:00Z",
+        "updatedAt": "2025-01-01T00:00:00Z",
+    }
+
+
+class FakeHTTP:
+    """Serves /transactions pages from a fixed list, tracking concurrency"""
+
+    def __init__(self, total):
+        self.rows = [transaction(i) for i in range(total)]
+        self.offsets = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def get_raw(self, path, query=None):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            offset, limit = query.get("offset", 0), query["limit"]
+            self.offsets.append(offset)
+            page = self.rows[offset : offset + limit]
+            body = {
+                "transactions": page,
+                "total": len(self.rows),
+                "hasMore": offset + limit < len(self.rows),
+            }
+            return json.dumps(body).encode()
+        finally:
+            self.in_flight -= 1
+
+
+async def test_list_all_fetches_every_page_in_order():
+    http = FakeHTTP(total=23)
+    transactions = TransactionsResource(http)
+
+    result = await transactions.list_all(ListTransactionsParams(limit=5), concurrency=2)
+
+    assert [tx.id for tx in result] == [f"tx_{i}" for i in range(23)]
+    assert sorted(http.offsets) == [0, 5, 10, 15, 20]
+    assert http.peak == 2
+
+
+async def test_list_all_single_page():
+    http = FakeHTTP(total=3)
+    transactions = TransactionsResource(http)
+
+    result = await transactions.list_all(ListTransactionsParams(limit=5))
+
+    assert len(result) == 3
+    assert http.offsets == [0]
+
+
+async def test_list_all_starts_from_offset():
+    http = FakeHTTP(total=12)
+    transactions = TransactionsResource(http)
+
+    result = await transactions.list_all(ListTransactionsParams(limit=4, offset=4))
+
+    assert [tx.id for tx in result] == [f"tx_{i}" for i in range(4, 12)]
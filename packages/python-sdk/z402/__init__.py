@@ -37,50 +37,107 @@ Example:
 
 __version__ = "0.1.0"
 
-# Main client
-from z402.client import Z402Client
-
-# Models
-from z402.models import (
-    CreatePaymentIntentParams,
-    ListTransactionsParams,
-    PaymentIntent,
-    PaymentParams,
-    PaymentStatus,
-    RefundParams,
-    Transaction,
-    TransactionStatus,
-    UpdateWebhookParams,
-    WebhookConfig,
-    WebhookEvent,
-)
-
-# Exceptions
-from z402.exceptions import (
-    APIError,
-    AuthenticationError,
-    BudgetExceededError,
-    InvalidRequestError,
-    NetworkError,
-    NotFoundError,
-    PaymentRequiredError,
-    RateLimitError,
-    WalletError,
-    WebhookVerificationError,
-    Z402Error,
-)
-
-# Resources
-from z402.resources import PaymentsResource, TransactionsResource, WebhooksResource
-
-# Utilities
-from z402.utils import (
-    AsyncHTTPClient,
-    BudgetManager,
-    construct_webhook_signature,
-    retry_with_backoff,
-    verify_webhook,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Public names are imported on first access (PEP 562), so e.g.
+# `from z402 import verify_webhook` doesn't pull in the HTTP client stack
+_EXPORTS = {
+    # Client
+    "Z402Client": "z402.client",
+    # Models
+    "CreatePaymentIntentParams": "z402.models",
+    "ListTransactionsParams": "z402.models",
+    "PaymentIntent": "z402.models",
+    "PaymentParams": "z402.models",
+    "PaymentStatus": "z402.models",
+    "RefundParams": "z402.models",
+    "Transaction": "z402.models",
+    "TransactionStatus": "z402.models",
+    "UpdateWebhookParams": "z402.models",
+    "WebhookConfig": "z402.models",
+    "WebhookEvent": "z402.models",
+    # Exceptions
+    "APIError": "z402.exceptions",
+    "AuthenticationError": "z402.exceptions",
+    "BudgetExceededError": "z402.exceptions",
+    "InvalidRequestError": "z402.exceptions",
+    "NetworkError": "z402.exceptions",
+    "NotFoundError": "z402.exceptions",
+    "PaymentRequiredError": "z402.exceptions",
+    "RateLimitError": "z402.exceptions",
+    "WalletError": "z402.exceptions",
+    "WebhookVerificationError": "z402.exceptions",
+    "Z402Error": "z402.exceptions",
+    # Resources
+    "PaymentsResource": "z402.resources",
+    "TransactionsResource": "z402.resources",
+    "WebhooksResource": "z402.resources",
+    # Utilities
+    "AsyncHTTPClient": "z402.utils.http",
+    "BudgetManager": "z402.utils.budget",
+    "construct_webhook_signature": "z402.utils.webhook",
+    "make_verifier": "z402.utils.webhook",
+    "retry_with_backoff": "z402.utils.retry",
+    "use_fast_event_loop": "z402.utils.loop",
+    "verify_webhook": "z402.utils.webhook",
+    "WebhookVerifier": "z402.utils.webhook",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(list(globals()) + list(_EXPORTS))
+
+
+if TYPE_CHECKING:
+    from z402.client import Z402Client
+    from z402.exceptions import (
+        APIError,
+        AuthenticationError,
+        BudgetExceededError,
+        InvalidRequestError,
+        NetworkError,
+        NotFoundError,
+        PaymentRequiredError,
+        RateLimitError,
+        WalletError,
+        WebhookVerificationError,
+        Z402Error,
+    )
+    from z402.models import (
+        CreatePaymentIntentParams,
+        ListTransactionsParams,
+        PaymentIntent,
+        PaymentParams,
+        PaymentStatus,
+        RefundParams,
+        Transaction,
+        TransactionStatus,
+        UpdateWebhookParams,
+        WebhookConfig,
+        WebhookEvent,
+    )
+    from z402.resources import PaymentsResource, TransactionsResource, WebhooksResource
+    from z402.utils.budget import BudgetManager
+    from z402.utils.http import AsyncHTTPClient
+    from z402.utils.loop import use_fast_event_loop
+    from z402.utils.retry import retry_with_backoff
+    from z402.utils.webhook import (
+        WebhookVerifier,
+        construct_webhook_signature,
+        make_verifier,
+        verify_webhook,
+    )
 
 __all__ = [
     # Version
@@ -121,4 +178,7 @@ __all__ = [
     "retry_with_backoff",
     "verify_webhook",
     "construct_webhook_signature",
+    "make_verifier",
+    "WebhookVerifier",
+    "use_fast_event_loop",
 ]
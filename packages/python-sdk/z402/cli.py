@@ -5,25 +5,20 @@ Command-line interface for testing and managing Z402 payments.
 """
 
 import asyncio
+import atexit
 import os
 from decimal import Decimal
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Coroutine, Dict, Optional, Tuple, TypeVar
 
 import typer
-from dotenv import load_dotenv
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-
-from z402 import (
-    BudgetManager,
-    CreatePaymentIntentParams,
-    ListTransactionsParams,
-    Z402Client,
-)
 
-# Load environment variables
-load_dotenv()
+from z402.utils.loop import new_event_loop
+
+# The SDK, rich tables/panels and dotenv are imported inside the commands
+# that use them, so `--help` and `version` start without loading them
+if TYPE_CHECKING:
+    from z402 import Z402Client
 
 app = typer.Typer(
     name="z402",
@@ -32,18 +27,64 @@ app = typer.Typer(
 )
 console = Console()
 
+T = TypeVar("T")
+
+# One event loop and one open client per (api key, network) for the life of
+# the process, so commands run back to back reuse pooled connections
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_clients: Dict[Tuple[str, str], "Z402Client"] = {}
+
 
-def get_client(
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the shared CLI event loop"""
+    global _loop
+    if _loop is None:
+        # uvloop's libuv-based loop when installed, stdlib selector otherwise
+        _loop = new_event_loop()
+        atexit.register(_shutdown)
+    return _loop.run_until_complete(coro)
+
+
+def _shutdown() -> None:
+    """Close shared clients and the event loop at interpreter exit"""
+    if _loop is None:
+        return
+    if _clients:
+        _loop.run_until_complete(
+            asyncio.gather(*(client.close() for client in _clients.values()))
+        )
+        _clients.clear()
+    _loop.close()
+
+
+@app.callback()
+def main(ctx: typer.Context) -> None:
+    """Z402 SDK CLI - Test and manage Zcash payments"""
+    if ctx.invoked_subcommand != "version":
+        # Load environment variables
+        from dotenv import load_dotenv
+
+        load_dotenv()
+
+
+async def get_client(
     api_key: Optional[str] = None,
     network: str = "testnet",
-) -> Z402Client:
-    """Get Z402 client instance"""
+) -> "Z402Client":
+    """Get the shared Z402 client for this key and network"""
+    from z402 import Z402Client
+
     key = api_key or os.getenv("Z402_API_KEY")
     if not key:
         console.print("[red]Error: Z402_API_KEY not found in environment[/red]")
         raise typer.Exit(1)
 
-    return Z402Client(api_key=key, network=network, debug=True)  # type: ignore
+    client = _clients.get((key, network))
+    if client is None:
+        client = Z402Client(api_key=key, network=network, debug=True)  # type: ignore
+        await client.__aenter__()
+        _clients[(key, network)] = client
+    return client
 
 
 @app.command()
@@ -54,27 +95,31 @@ def create_payment(
     network: str = typer.Option("testnet", "--network", "-n", help="Network (testnet/mainnet)"),
 ):
     """Create a new payment intent"""
+    from rich.table import Table
+
+    from z402 import CreatePaymentIntentParams
 
     async def run():
-        async with get_client(api_key, network) as client:
-            intent = await client.payments.create(
-                CreatePaymentIntentParams(amount=amount, resource=resource)
-            )
+        client = await get_client(api_key, network)
 
-            table = Table(title="Payment Intent Created")
-            table.add_column("Field", style="cyan")
-            table.add_column("Value", style="green")
+        intent = await client.payments.create(
+            CreatePaymentIntentParams(amount=amount, resource=resource)
+        )
 
-            table.add_row("ID", intent.id)
-            table.add_row("Amount", f"{intent.amount} ZEC")
-            table.add_row("Resource", intent.resource)
-            table.add_row("Status", intent.status.value)
-            table.add_row("Zcash Address", intent.zcash_address)
-            table.add_row("Expires At", str(intent.expires_at))
+        table = Table(title="Payment Intent Created")
+        table.add_column("Field", style="cyan")
+        table.add_column("Value", style="green")
 
-            console.print(table)
+        table.add_row("ID", intent.id)
+        table.add_row("Amount", f"{intent.amount} ZEC")
+        table.add_row("Resource", intent.resource)
+        table.add_row("Status", intent.status)
+        table.add_row("Zcash Address", intent.zcash_address)
+        table.add_row("Expires At", str(intent.expires_at))
 
-    asyncio.run(run())
+        console.print(table)
+
+    _run(run())
 
 
 @app.command()
@@ -84,22 +129,24 @@ def get_payment(
     network: str = typer.Option("testnet", "--network", "-n", help="Network"),
 ):
     """Get payment intent details"""
+    from rich.panel import Panel
 
     async def run():
-        async with get_client(api_key, network) as client:
-            intent = await client.payments.get(payment_id)
+        client = await get_client(api_key, network)
+
+        intent = await client.payments.get(payment_id)
 
-            console.print(Panel.fit(
-                f"[bold]Payment Intent[/bold]\n\n"
-                f"ID: {intent.id}\n"
-                f"Amount: {intent.amount} ZEC\n"
-                f"Resource: {intent.resource}\n"
-                f"Status: {intent.status.value}\n"
-                f"Address: {intent.zcash_address}",
-                title="Payment Details",
-            ))
+        console.print(Panel.fit(
+            f"[bold]Payment Intent[/bold]\n\n"
+            f"ID: {intent.id}\n"
+            f"Amount: {intent.amount} ZEC\n"
+            f"Resource: {intent.resource}\n"
+            f"Status: {intent.status}\n"
+            f"Address: {intent.zcash_address}",
+            title="Payment Details",
+        ))
 
-    asyncio.run(run())
+    _run(run())
 
 
 @app.command()
@@ -110,32 +157,31 @@ def list_transactions(
     network: str = typer.Option("testnet", "--network", "-n", help="Network"),
 ):
     """List transactions"""
+    from rich.table import Table
+
+    from z402 import ListTransactionsParams
 
     async def run():
-        async with get_client(api_key, network) as client:
-            params = ListTransactionsParams(limit=limit)
-            if status:
-                params.status = status  # type: ignore
+        client = await get_client(api_key, network)
 
-            response = await client.transactions.list(params)
+        params = ListTransactionsParams(limit=limit)
+        if status:
+            params.status = status  # type: ignore
 
-            table = Table(title=f"Transactions ({response.total} total)")
-            table.add_column("ID", style="cyan")
-            table.add_column("Amount", style="green")
-            table.add_column("Status", style="yellow")
-            table.add_column("Resource", style="blue")
+        response = await client.transactions.list(params)
 
-            for tx in response.transactions:
-                table.add_row(
-                    tx.id[:12] + "...",
-                    f"{tx.amount} {tx.currency}",
-                    tx.status.value,
-                    tx.resource_url[:30] + "..." if len(tx.resource_url) > 30 else tx.resource_url,
-                )
+        table = Table(title=f"Transactions ({response.total} total)")
+        table.add_column("ID", style="cyan")
+        table.add_column("Amount", style="green")
+        table.add_column("Status", style="yellow")
+        table.add_column("Resource", style="blue")
 
-            console.print(table)
+        for tx in response.transactions:
+            table.add_row(*tx.display_row)
 
-    asyncio.run(run())
+        console.print(table)
+
+    _run(run())
 
 
 @app.command()
@@ -144,6 +190,9 @@ def budget_stats(
     hourly_limit: Optional[str] = typer.Option(None, "--hourly-limit", help="Hourly limit in ZEC"),
 ):
     """Show budget statistics (demo)"""
+    from rich.table import Table
+
+    from z402 import BudgetManager
 
     async def run():
         budget = BudgetManager(
@@ -152,9 +201,11 @@ def budget_stats(
         )
 
         # Simulate some spending
-        await budget.record_spend("0.05", "tx_demo_1")
-        await budget.record_spend("0.03", "tx_demo_2")
-        await budget.record_spend("0.02", "tx_demo_3")
+        await asyncio.gather(
+            budget.record_spend("0.05", "tx_demo_1"),
+            budget.record_spend("0.03", "tx_demo_2"),
+            budget.record_spend("0.02", "tx_demo_3"),
+        )
 
         stats = await budget.get_statistics()
 
@@ -179,7 +230,7 @@ def budget_stats(
         history = await budget.get_transaction_history()
         console.print(f"\n[bold]Transaction History:[/bold] {len(history)} transactions")
 
-    asyncio.run(run())
+    _run(run())
 
 
 @app.command()
@@ -188,26 +239,30 @@ def webhook_config(
     network: str = typer.Option("testnet", "--network", "-n", help="Network"),
 ):
     """Get webhook configuration"""
+    from rich.panel import Panel
 
     async def run():
-        async with get_client(api_key, network) as client:
-            config = await client.webhooks.get()
+        client = await get_client(api_key, network)
+
+        config = await client.webhooks.get()
 
-            console.print(Panel.fit(
-                f"[bold]Webhook Configuration[/bold]\n\n"
-                f"URL: {config.url}\n"
-                f"Secret: {config.secret[:10]}...\n"
-                f"Events: {', '.join(config.events)}\n"
-                f"Enabled: {config.enabled}",
-                title="Webhook Config",
-            ))
+        console.print(Panel.fit(
+            f"[bold]Webhook Configuration[/bold]\n\n"
+            f"URL: {config.url}\n"
+            f"Secret: {config.secret[:10]}...\n"
+            f"Events: {', '.join(config.events)}\n"
+            f"Enabled: {config.enabled}",
+            title="Webhook Config",
+        ))
 
-    asyncio.run(run())
+    _run(run())
 
 
 @app.command()
 def version():
     """Show SDK version"""
+    from rich.panel import Panel
+
     from z402 import __version__
 
     console.print(Panel.fit(
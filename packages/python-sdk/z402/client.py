@@ -1,11 +1,14 @@
 """Z402 SDK Client"""
 
-from typing import Literal, Optional
+import asyncio
+from typing import Any, Dict, Iterable, List, Literal, Optional
 
+from z402.exceptions import BudgetExceededError
+from z402.models.payment import CreatePaymentIntentParams, PaymentIntent, PaymentParams
 from z402.resources.payments import PaymentsResource
 from z402.resources.transactions import TransactionsResource
 from z402.resources.webhooks import WebhooksResource
-from z402.utils.budget import BudgetManager
+from z402.utils.budget import BudgetManager, BudgetReservation
 from z402.utils.http import AsyncHTTPClient
 
 
@@ -24,6 +27,11 @@ class Z402Client:
         timeout: Request timeout in seconds (default: 30)
         debug: Enable debug logging (default: False)
         budget_manager: Optional budget manager for spending limits
+        http2: Multiplex requests over one HTTP/2 connection (default: False,
+            requires `pip install z402-sdk[http2]`)
+        pool_size: Maximum number of open connections (default: 100)
+        pool_size_per_host: Maximum connections per host (default: 0, no limit)
+        cache_ttl: Seconds to cache GET lookups for (default: 0, disabled)
 
     Example:
         ```python
@@ -71,6 +79,10 @@ class Z402Client:
         timeout: int = 30,
         debug: bool = False,
         budget_manager: Optional[BudgetManager] = None,
+        http2: bool = False,
+        pool_size: int = 100,
+        pool_size_per_host: int = 0,
+        cache_ttl: float = 0,
     ) -> None:
         if not api_key:
             raise ValueError("API key is required")
@@ -93,6 +105,10 @@ class Z402Client:
             max_retries=max_retries,
             timeout=timeout,
             debug=debug,
+            http2=http2,
+            pool_size=pool_size,
+            pool_size_per_host=pool_size_per_host,
+            cache_ttl=cache_ttl,
         )
 
         # Initialize resources
@@ -162,30 +178,119 @@ class Z402Client:
             )
             ```
         """
-        from z402.models.payment import CreatePaymentIntentParams, PaymentParams
+        reservation = None
+        if check_budget and self.budget:
+            [reservation] = await self._reserve(self.budget, [amount])
+
+        return await self._pay_reserved(
+            amount, resource, from_address, tx_id, metadata, reservation
+        )
+
+    async def pay_many(
+        self,
+        items: Iterable[Dict[str, Any]],
+        check_budget: bool = True,
+        concurrency: int = 10,
+    ) -> List[Any]:
+        """
+        Create and pay for several resources concurrently.
+
+        Each item holds the keyword arguments of `pay` (amount, resource,
+        from_address, tx_id and optionally metadata). The API has no bulk
+        endpoint, so the items run as parallel `pay` calls over the shared
+        connection pool, at most `concurrency` at once.
+
+        Args:
+            items: Payments to make
+            check_budget: Check that the whole batch fits the budget before
+                paying for any of it (default: True)
+            concurrency: Maximum number of concurrent payments (default: 10)
+
+        Returns:
+            Payment intents, in the same order as items
+
+        Raises:
+            ValueError: If the batch would exceed budget limits
+
+        Example:
+            ```python
+            payments = await client.pay_many([
+                {"amount": "0.01", "resource": "/api/a", "from_address": "zs1...", "tx_id": "..."},
+                {"amount": "0.02", "resource": "/api/b", "from_address": "zs1...", "tx_id": "..."},
+            ])
+            ```
+        """
+        items = list(items)
 
-        # Check budget if enabled
+        # Reserve the batch as a whole: per-item checks running concurrently
+        # would each see the same remaining budget and could overspend it
+        reservations: List[Optional[BudgetReservation]] = [None] * len(items)
         if check_budget and self.budget:
-            if not await self.budget.can_spend(amount):
-                raise ValueError("Spending would exceed budget limits")
-
-        # Create payment intent
-        intent = await self.payments.create(
-            CreatePaymentIntentParams(
-                amount=amount,
-                resource=resource,
-                metadata=metadata,
+            reservations = list(
+                await self._reserve(self.budget, (item["amount"] for item in items))
             )
-        )
 
-        # Submit payment
-        paid = await self.payments.pay(
-            intent.id,
-            PaymentParams(from_address=from_address, tx_id=tx_id),
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def pay_one(item: Dict[str, Any], reservation: Optional[BudgetReservation]) -> Any:
+            async with semaphore:
+                return await self._pay_reserved(
+                    item["amount"],
+                    item["resource"],
+                    item["from_address"],
+                    item["tx_id"],
+                    item.get("metadata"),
+                    reservation,
+                )
+
+        return list(
+            await asyncio.gather(
+                *(pay_one(item, reservation) for item, reservation in zip(items, reservations))
+            )
         )
 
+    @staticmethod
+    async def _reserve(budget: BudgetManager, amounts: Iterable[str]) -> List[BudgetReservation]:
+        """Reserve budget for the amounts, raising ValueError if they don't fit"""
+        try:
+            return await budget.reserve(amounts)
+        except BudgetExceededError:
+            raise ValueError("Spending would exceed budget limits") from None
+
+    async def _pay_reserved(
+        self,
+        amount: str,
+        resource: str,
+        from_address: str,
+        tx_id: str,
+        metadata: Optional[dict],
+        reservation: Optional[BudgetReservation],
+    ) -> PaymentIntent:
+        """Create and pay an intent, settling its budget reservation either way"""
+        try:
+            # Create payment intent
+            intent = await self.payments.create(
+                CreatePaymentIntentParams(
+                    amount=amount,
+                    resource=resource,
+                    metadata=metadata,
+                )
+            )
+
+            # Submit payment
+            paid = await self.payments.pay(
+                intent.id,
+                PaymentParams(from_address=from_address, tx_id=tx_id),
+            )
+        except BaseException:
+            if reservation is not None:
+                await reservation.release()
+            raise
+
         # Record in budget if enabled
-        if self.budget:
+        if reservation is not None:
+            await reservation.record(paid.id, metadata)
+        elif self.budget:
             await self.budget.record_spend(amount, paid.id, metadata)
 
         return paid
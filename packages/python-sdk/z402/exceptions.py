@@ -10,6 +10,9 @@ from typing import Any, Optional
 class Z402Error(Exception):
     """Base exception for all Z402 SDK errors."""
 
+    # Slots keep instances from allocating a per-instance __dict__
+    __slots__ = ("message", "status_code", "code", "details")
+
     def __init__(
         self,
         message: str,
@@ -28,10 +31,22 @@ class Z402Error(Exception):
             return f"[{self.status_code}] {self.message}"
         return self.message
 
+    def __reduce__(self) -> Any:
+        # Slot attributes aren't in __dict__, so pass them to pickle explicitly
+        state = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if hasattr(self, name)
+        }
+        return type(self), self.args, state
+
 
 class AuthenticationError(Z402Error):
     """Raised when authentication fails (401)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Authentication failed", details: Optional[Any] = None):
         super().__init__(message, status_code=401, code="authentication_error", details=details)
 
@@ -39,6 +54,8 @@ class AuthenticationError(Z402Error):
 class InvalidRequestError(Z402Error):
     """Raised when request is invalid (400)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Any] = None):
         super().__init__(message, status_code=400, code="invalid_request", details=details)
 
@@ -46,6 +63,8 @@ class InvalidRequestError(Z402Error):
 class NotFoundError(Z402Error):
     """Raised when resource is not found (404)."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Resource not found", details: Optional[Any] = None):
         super().__init__(message, status_code=404, code="not_found", details=details)
 
@@ -53,6 +72,8 @@ class NotFoundError(Z402Error):
 class RateLimitError(Z402Error):
     """Raised when rate limit is exceeded (429)."""
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str = "Rate limit exceeded",
@@ -66,6 +87,8 @@ class RateLimitError(Z402Error):
 class PaymentRequiredError(Z402Error):
     """Raised when payment is required to access resource (402)."""
 
+    __slots__ = ("amount", "resource")
+
     def __init__(
         self,
         message: str = "Payment required",
@@ -81,12 +104,14 @@ class PaymentRequiredError(Z402Error):
 class APIError(Z402Error):
     """Raised for general API errors."""
 
-    pass
+    __slots__ = ()
 
 
 class NetworkError(Z402Error):
     """Raised when network request fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Network request failed", details: Optional[Any] = None):
         super().__init__(message, status_code=0, code="network_error", details=details)
 
@@ -94,6 +119,8 @@ class NetworkError(Z402Error):
 class WebhookVerificationError(Z402Error):
     """Raised when webhook signature verification fails."""
 
+    __slots__ = ()
+
     def __init__(
         self, message: str = "Webhook verification failed", details: Optional[Any] = None
     ):
@@ -105,6 +132,8 @@ class WebhookVerificationError(Z402Error):
 class BudgetExceededError(Z402Error):
     """Raised when spending would exceed budget limit."""
 
+    __slots__ = ("limit", "current")
+
     def __init__(
         self,
         message: str = "Budget limit exceeded",
@@ -120,5 +149,7 @@ class BudgetExceededError(Z402Error):
 class WalletError(Z402Error):
     """Raised for wallet-related errors."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: Optional[Any] = None):
         super().__init__(message, status_code=None, code="wallet_error", details=details)
@@ -4,9 +4,15 @@ Middleware for FastAPI and Flask
 Provides payment protection middleware for web frameworks.
 """
 
+import asyncio
 import os
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
 from functools import wraps
-from typing import Any, Awaitable, Callable, Optional
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, Mapping, Optional, Tuple
 
 try:
     from fastapi import Request, Response
@@ -23,12 +29,263 @@ except ImportError:
 
 import aiohttp
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 from z402.exceptions import Z402Error
+from z402.utils.serialization import dumps, loads
+from z402.utils.units import zec_to_zat
+
+
+def _new_session(http2: bool = False) -> Any:
+    """
+    Create a client whose connections are kept alive between verifications.
+
+    With http2, an httpx client that multiplexes concurrent verifications
+    over one connection; otherwise an aiohttp session.
+    """
+    if http2:
+        return httpx.AsyncClient(
+            http2=True,
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=100, keepalive_expiry=75),
+        )
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=75, ttl_dns_cache=300)
+    )
+
+
+def _is_closed(session: Any) -> bool:
+    """Whether an aiohttp session or httpx client has been closed"""
+    if isinstance(session, aiohttp.ClientSession):
+        return session.closed
+    return bool(session.is_closed)
+
+
+async def _close_session(session: Any) -> None:
+    """Close an aiohttp session or httpx client if it is still open"""
+    if _is_closed(session):
+        return
+    if isinstance(session, aiohttp.ClientSession):
+        await session.close()
+    else:
+        await session.aclose()
+
+
+class _VerifyLimiter:
+    """
+    Caps in-flight verification requests so bursts don't overwhelm the API.
+
+    The limit adapts AIMD-style, like TCP congestion control: a 429 halves
+    it (down to `min_limit`), and each run of `increase_after` successful
+    responses raises it by one (up to `max_limit`).
+    """
+
+    def __init__(self, max_limit: int = 64, min_limit: int = 8, increase_after: int = 100):
+        self.limit = max_limit
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.increase_after = increase_after
+        self._in_flight = 0
+        self._successes = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot"""
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before cancellation
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self) -> None:
+        """Free a slot and hand it to the next waiter, if the limit allows"""
+        self._in_flight -= 1
+        self._wake()
+
+    def record(self, status: int) -> None:
+        """Adjust the limit from a verification response status"""
+        if status == 429:
+            self.limit = max(self.min_limit, self.limit // 2)
+            self._successes = 0
+        elif status < 400:
+            self._successes += 1
+            if self._successes >= self.increase_after:
+                self._successes = 0
+                if self.limit < self.max_limit:
+                    self.limit += 1
+                    self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
+
+
+# Longest a 429's Retry-After may hold a verification slot, in seconds
+_MAX_RETRY_AFTER = 5.0
+
+# One limiter per event loop, shared by every middleware and dependency,
+# since they all verify against the same API
+_limiters: "weakref.WeakKeyDictionary[Any, _VerifyLimiter]" = weakref.WeakKeyDictionary()
+
+
+def _retry_after_delay(value: Optional[str]) -> float:
+    """Seconds to back off for a Retry-After header (HTTP-dates fall back to 1s)"""
+    try:
+        return min(max(float(value), 0.0), _MAX_RETRY_AFTER) if value else 1.0
+    except ValueError:
+        return 1.0
+
+
+async def _get(session: Any, url: str, headers: Dict[str, str]) -> Tuple[int, bytes, Optional[str]]:
+    """GET url on an aiohttp session or httpx client, returning status, body and Retry-After"""
+    if isinstance(session, aiohttp.ClientSession):
+        async with session.get(url, headers=headers) as response:
+            return response.status, await response.read(), response.headers.get("retry-after")
+
+    response = await session.get(url, headers=headers)
+    return response.status_code, response.content, response.headers.get("retry-after")
+
+
+async def _fetch(session: Any, url: str, headers: Dict[str, str]) -> Tuple[int, bytes]:
+    """
+    GET url on an aiohttp session or httpx client, returning status and body.
+
+    Runs under the verification limiter. On a 429 the slot is held for the
+    Retry-After delay, so queued verifications back off along with this one,
+    and the request is then retried once before its status is returned.
+    """
+    loop = asyncio.get_running_loop()
+    limiter = _limiters.get(loop)
+    if limiter is None:
+        limiter = _limiters[loop] = _VerifyLimiter()
+
+    await limiter.acquire()
+    try:
+        status, raw, retry_after = await _get(session, url, headers)
+        limiter.record(status)
+        if status == 429:
+            await asyncio.sleep(_retry_after_delay(retry_after))
+            status, raw, _ = await _get(session, url, headers)
+            limiter.record(status)
+    finally:
+        limiter.release()
+
+    return status, raw
+
+
+# One session per event loop and transport, since a session can't be used
+# outside the loop it was created on. Weak keys let a closed loop's entry go away.
+_shared_sessions: "weakref.WeakKeyDictionary[Any, Dict[bool, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _get_shared_session(http2: bool = False) -> Any:
+    """Get the verification session for the running event loop"""
+    sessions = _shared_sessions.setdefault(asyncio.get_running_loop(), {})
+    session = sessions.get(http2)
+    if session is None or _is_closed(session):
+        session = sessions[http2] = _new_session(http2)
+    return session
+
+
+async def close_shared_session() -> None:
+    """
+    Close the verification sessions used by `z402_required` and
+    `Z402Middleware` on the running loop.
+
+    Example:
+        ```python
+        app.add_event_handler("shutdown", close_shared_session)
+        ```
+    """
+    sessions = _shared_sessions.pop(asyncio.get_running_loop(), {})
+    for session in sessions.values():
+        await _close_session(session)
+
+
+def _payment_intent_header(scope: Mapping[str, Any]) -> Optional[str]:
+    """
+    Find the payment intent header in a raw ASGI scope.
+
+    Scans the header tuples once instead of building a Headers multidict;
+    ASGI header names are already lowercase.
+    """
+    headers: Iterable[Tuple[bytes, bytes]] = scope["headers"]
+    for name, value in headers:
+        if name == b"z402-payment-intent":
+            return value.decode("latin-1")
+    return None
+
+
+# Settled is a terminal state, so a settled verification can be reused for
+# repeat requests under the same payment instead of asking the API again.
+# Entries are keyed by (base_url, api_key, payment intent ID), so a route only
+# reuses verifications made against its own network with its own credentials.
+# Values are (expires_at on the monotonic clock, payment intent), in LRU order.
+_VERIFIED_TTL = 300
+_VERIFIED_MAX_ENTRIES = 10_000
+_CacheKey = Tuple[str, str, str]
+_verified_cache: "OrderedDict[_CacheKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+# A threading lock rather than an asyncio one: Flask calls in from worker
+# threads, and the critical sections never await
+_verified_lock = threading.Lock()
+
+
+def _get_cached(key: _CacheKey) -> Optional[Dict[str, Any]]:
+    """Get a cached settled payment intent, or None if absent or expired"""
+    with _verified_lock:
+        entry = _verified_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _verified_cache[key]
+            return None
+        _verified_cache.move_to_end(key)
+        # Copies on both sides, so a caller mutating its payment intent
+        # can't change what later requests see
+        return dict(entry[1])
+
+
+def _put_cached(
+    key: _CacheKey, payment_intent: Dict[str, Any], ttl: float = _VERIFIED_TTL
+) -> None:
+    """Cache a verified payment intent if it has settled"""
+    if payment_intent.get("status") != "settled":
+        return
+    with _verified_lock:
+        _verified_cache[key] = (time.monotonic() + ttl, dict(payment_intent))
+        _verified_cache.move_to_end(key)
+        if len(_verified_cache) > _VERIFIED_MAX_ENTRIES:
+            _verified_cache.popitem(last=False)
 
 
 # FastAPI Middleware
 if FASTAPI_AVAILABLE:
 
+    class _JSONResponse(JSONResponse):
+        """JSONResponse encoded with orjson when it is installed"""
+
+        def render(self, content: Any) -> bytes:
+            return dumps(content)
+
     class Z402Middleware:
         """
         FastAPI middleware for Z402 payment protection.
@@ -36,7 +293,7 @@ if FASTAPI_AVAILABLE:
         Example:
             ```python
             from fastapi import FastAPI
-            from z402.middleware import Z402Middleware
+            from z402.middleware import Z402Middleware, close_shared_session
 
             app = FastAPI()
 
@@ -47,7 +304,22 @@ if FASTAPI_AVAILABLE:
                 amount="0.01",
                 resource="/api/premium"
             )
+            app.add_event_handler("shutdown", close_shared_session)
             ```
+
+        Verifications share the per-loop connection pool used by
+        `z402_required`. `add_middleware` wraps the app, so the middleware
+        can't register its own shutdown handler: register
+        `close_shared_session` yourself (or call it from your lifespan).
+
+        Pass `http2=True` to send verifications over HTTP/2 with httpx, so
+        concurrent requests share one connection (requires
+        `pip install z402-sdk[http2]`).
+
+        Pass `prefetch` to run handler preparation that doesn't depend on
+        the payment (e.g. warming a cache) concurrently with verification.
+        It is awaited before the request continues, and runs even if
+        verification fails, so it must be safe to do for unpaid requests.
         """
 
         def __init__(
@@ -58,57 +330,110 @@ if FASTAPI_AVAILABLE:
             amount: str,
             resource: str,
             base_url: str = "https://api.z402.io/v1",
+            prefetch: Optional[Callable[[Request], Awaitable[None]]] = None,
+            http2: bool = False,
         ) -> None:
+            if http2 and not HTTPX_AVAILABLE:
+                raise ImportError(
+                    "HTTP/2 support requires httpx. Install with: pip install z402-sdk[http2]"
+                )
+
             self.app = app
             self.api_key = api_key
             self.protected_paths = protected_paths
+            # Requests for a protected route itself skip the regex entirely
+            self._exact_paths = frozenset(protected_paths)
+            # One compiled prefix match instead of a startswith() per path;
+            # with no protected paths, a pattern that never matches
+            self._path_re = re.compile(
+                "^(?:" + "|".join(re.escape(path) for path in protected_paths) + ")"
+                if protected_paths
+                else "(?!)"
+            )
             self.amount = amount
+            self._amount_zat = zec_to_zat(amount)
             self.resource = resource
             self.base_url = base_url
+            self.prefetch = prefetch
+            self.http2 = http2
+
+            # The "payment required" body only depends on configuration, so
+            # it is encoded once rather than on every request without payment
+            self._payment_required_body = dumps({
+                "error": {
+                    "code": "payment_required",
+                    "message": "Payment required to access this resource",
+                },
+                "payment": {
+                    "amount": amount,
+                    "currency": "ZEC",
+                    "resource": resource,
+                },
+            })
+
+        async def close(self) -> None:
+            """Close the verification sessions on the running loop (see `close_shared_session`)"""
+            await close_shared_session()
+
+        async def _verify(self, payment_intent_id: str) -> Dict[str, Any]:
+            """Verify a payment intent, using the settled-verification cache"""
+            cache_key = (self.base_url, self.api_key, payment_intent_id)
+            payment_intent = _get_cached(cache_key)
+            if payment_intent is not None:
+                return payment_intent
+
+            verify_url = f"{self.base_url}/payment-intents/{payment_intent_id}/verify"
+            headers = {"X-API-Key": self.api_key}
+
+            session = await _get_shared_session(self.http2)
+            status, raw = await _fetch(session, verify_url, headers)
+            if status >= 400:
+                raise Exception(f"Verification failed: {status}")
+
+            verified: Dict[str, Any] = loads(raw)
+
+            _put_cached(cache_key, verified)
+            return verified
 
         async def __call__(
             self,
             request: Request,
             call_next: Callable[[Request], Awaitable[Response]],
         ) -> Response:
-            # Check if path is protected
-            if not any(request.url.path.startswith(path) for path in self.protected_paths):
+            # Check if path is protected, reading the raw ASGI path so
+            # unprotected requests never build a URL or Headers object
+            path = request.scope["path"]
+            if path not in self._exact_paths and not self._path_re.match(path):
                 return await call_next(request)
 
             # Check for payment intent ID
-            payment_intent_id = request.headers.get("z402-payment-intent")
+            payment_intent_id = _payment_intent_header(request.scope)
 
             if not payment_intent_id:
-                return JSONResponse(
+                return Response(
+                    content=self._payment_required_body,
                     status_code=402,
-                    content={
-                        "error": {
-                            "code": "payment_required",
-                            "message": "Payment required to access this resource",
-                        },
-                        "payment": {
-                            "amount": self.amount,
-                            "currency": "ZEC",
-                            "resource": self.resource,
-                        },
-                    },
+                    media_type="application/json",
                 )
 
             # Verify payment
             try:
-                verify_url = f"{self.base_url}/payment-intents/{payment_intent_id}/verify"
-                headers = {"X-API-Key": self.api_key}
-
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(verify_url, headers=headers) as response:
-                        if not response.ok:
-                            raise Exception(f"Verification failed: {response.status}")
-
-                        payment_intent = await response.json()
+                if self.prefetch is None:
+                    payment_intent = await self._verify(payment_intent_id)
+                else:
+                    # Overlap the verification round trip with the prefetch
+                    # ensure_future accepts any awaitable, not just a coroutine
+                    prefetch_task: "asyncio.Future[None]" = asyncio.ensure_future(
+                        self.prefetch(request)
+                    )
+                    try:
+                        payment_intent = await self._verify(payment_intent_id)
+                    finally:
+                        await prefetch_task
 
                 # Check status
                 if payment_intent["status"] != "settled":
-                    return JSONResponse(
+                    return _JSONResponse(
                         status_code=402,
                         content={
                             "error": {
@@ -123,8 +448,8 @@ if FASTAPI_AVAILABLE:
                     )
 
                 # Check amount
-                if float(payment_intent["amount"]) < float(self.amount):
-                    return JSONResponse(
+                if zec_to_zat(payment_intent["amount"]) < self._amount_zat:
+                    return _JSONResponse(
                         status_code=402,
                         content={
                             "error": {
@@ -144,7 +469,7 @@ if FASTAPI_AVAILABLE:
                 return await call_next(request)
 
             except Exception as error:
-                return JSONResponse(
+                return _JSONResponse(
                     status_code=500,
                     content={
                         "error": {
@@ -160,16 +485,23 @@ if FASTAPI_AVAILABLE:
         resource: str,
         api_key: Optional[str] = None,
         base_url: str = "https://api.z402.io/v1",
+        http2: bool = False,
     ) -> Callable:
         """
         FastAPI dependency for protecting individual routes.
 
+        Verification requests share one connection pool per event loop;
+        register `close_shared_session` as a shutdown handler to close it.
+        Pass `http2=True` to multiplex them over one HTTP/2 connection
+        instead (requires `pip install z402-sdk[http2]`).
+
         Example:
             ```python
             from fastapi import Depends, FastAPI
-            from z402.middleware import z402_required
+            from z402.middleware import close_shared_session, z402_required
 
             app = FastAPI()
+            app.add_event_handler("shutdown", close_shared_session)
 
             @app.get("/premium/data", dependencies=[Depends(z402_required(amount="0.01", resource="/premium/data"))])
             async def get_premium_data(request: Request):
@@ -177,31 +509,44 @@ if FASTAPI_AVAILABLE:
                 return {"data": "Premium content", "payment": payment}
             ```
         """
+        if http2 and not HTTPX_AVAILABLE:
+            raise ImportError(
+                "HTTP/2 support requires httpx. Install with: pip install z402-sdk[http2]"
+            )
+
+        amount_zat = zec_to_zat(amount)
+
         async def dependency(request: Request) -> dict:
             api_key_used = api_key or os.getenv("Z402_API_KEY")
             if not api_key_used:
                 raise ValueError("Z402 API key not provided")
 
-            payment_intent_id = request.headers.get("z402-payment-intent")
+            payment_intent_id = _payment_intent_header(request.scope)
 
             if not payment_intent_id:
                 raise Z402Error("Payment required", status_code=402)
 
             # Verify payment
-            verify_url = f"{base_url}/payment-intents/{payment_intent_id}/verify"
-            headers = {"X-API-Key": api_key_used}
+            cache_key = (base_url, api_key_used, payment_intent_id)
+            payment_intent = _get_cached(cache_key)
+
+            if payment_intent is None:
+                verify_url = f"{base_url}/payment-intents/{payment_intent_id}/verify"
+                headers = {"X-API-Key": api_key_used}
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(verify_url, headers=headers) as response:
-                    if not response.ok:
-                        raise Z402Error("Payment verification failed", status_code=402)
+                session = await _get_shared_session(http2)
+                status, raw = await _fetch(session, verify_url, headers)
+                if status >= 400:
+                    raise Z402Error("Payment verification failed", status_code=402)
 
-                    payment_intent = await response.json()
+                payment_intent = loads(raw)
+
+                _put_cached(cache_key, payment_intent)
 
             if payment_intent["status"] != "settled":
                 raise Z402Error("Payment not settled", status_code=402)
 
-            if float(payment_intent["amount"]) < float(amount):
+            if zec_to_zat(payment_intent["amount"]) < amount_zat:
                 raise Z402Error("Insufficient payment", status_code=402)
 
             request.state.z402_payment = payment_intent
@@ -212,6 +557,31 @@ if FASTAPI_AVAILABLE:
 
 # Flask Middleware
 if FLASK_AVAILABLE:
+    # Shared across requests and threads so verifications reuse pooled
+    # keep-alive connections instead of opening a new one each time. Built
+    # on first use, so importing this module doesn't require requests
+    _verify_session: Optional[Any] = None
+    _verify_session_lock = threading.Lock()
+
+    def _get_verify_session() -> Any:
+        """Get the shared requests session for Flask verifications"""
+        global _verify_session
+        if _verify_session is None:
+            with _verify_session_lock:
+                if _verify_session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+
+                    session = requests.Session()
+                    session.mount(
+                        "https://", HTTPAdapter(pool_connections=10, pool_maxsize=50)
+                    )
+                    session.headers["User-Agent"] = "z402-python-sdk/0.1.0"
+                    _verify_session = session
+        return _verify_session
+
+    # The decorator always verifies against the production API
+    _FLASK_BASE_URL = "https://api.z402.io/v1"
 
     def flask_z402_required(amount: str, resource: str):
         """
@@ -230,6 +600,8 @@ if FLASK_AVAILABLE:
                 return {"data": "Premium content"}
             ```
         """
+        amount_zat = zec_to_zat(amount)
+
         def decorator(f):
             @wraps(f)
             def wrapper(*args, **kwargs):
@@ -255,15 +627,20 @@ if FLASK_AVAILABLE:
                     }), 402
 
                 # Verify payment (synchronous for Flask)
-                import requests
-
-                verify_url = f"https://api.z402.io/v1/payment-intents/{payment_intent_id}/verify"
+                verify_url = f"{_FLASK_BASE_URL}/payment-intents/{payment_intent_id}/verify"
                 headers = {"X-API-Key": api_key}
+                cache_key = (_FLASK_BASE_URL, api_key, payment_intent_id)
 
                 try:
-                    response = requests.get(verify_url, headers=headers)
-                    response.raise_for_status()
-                    payment_intent = response.json()
+                    payment_intent = _get_cached(cache_key)
+
+                    if payment_intent is None:
+                        response = _get_verify_session().get(
+                            verify_url, headers=headers, timeout=10
+                        )
+                        response.raise_for_status()
+                        payment_intent = loads(response.content)
+                        _put_cached(cache_key, payment_intent)
 
                     if payment_intent["status"] != "settled":
                         return jsonify({
@@ -271,7 +648,7 @@ if FLASK_AVAILABLE:
                             "payment": {"status": payment_intent["status"]},
                         }), 402
 
-                    if float(payment_intent["amount"]) < float(amount):
+                    if zec_to_zat(payment_intent["amount"]) < amount_zat:
                         return jsonify({
                             "error": {"code": "insufficient_payment"},
                             "payment": {
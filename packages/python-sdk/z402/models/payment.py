@@ -2,13 +2,18 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class PaymentStatus(str, Enum):
-    """Payment status enum"""
+    """
+    Payment status enum.
+
+    `PaymentIntent.status` holds the plain string value; members compare
+    equal to it, e.g. `intent.status == PaymentStatus.SETTLED`.
+    """
 
     PENDING = "pending"
     PAID = "paid"
@@ -17,21 +22,24 @@ class PaymentStatus(str, Enum):
     EXPIRED = "expired"
 
 
+# Validated as a plain string membership check, with no Enum instance per model
+PaymentStatusValue = Literal["pending", "paid", "settled", "failed", "expired"]
+
+
 class PaymentIntent(BaseModel):
     """Payment intent model"""
 
     id: str
     amount: str
     resource: str
-    status: PaymentStatus
+    status: PaymentStatusValue
     zcash_address: str = Field(alias="zcashAddress")
     expires_at: datetime = Field(alias="expiresAt")
     metadata: Optional[Dict[str, Any]] = None
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class CreatePaymentIntentParams(BaseModel):
@@ -42,8 +50,7 @@ class CreatePaymentIntentParams(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
     expires_in: Optional[int] = Field(default=3600, alias="expiresIn")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class PaymentParams(BaseModel):
@@ -52,5 +59,4 @@ class PaymentParams(BaseModel):
     from_address: str = Field(alias="fromAddress")
     tx_id: str = Field(alias="txId")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
@@ -2,13 +2,19 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TransactionStatus(str, Enum):
-    """Transaction status enum"""
+    """
+    Transaction status enum.
+
+    `Transaction.status` holds the plain string value; members compare
+    equal to it, e.g. `tx.status == TransactionStatus.SETTLED`.
+    """
 
     PENDING = "pending"
     SETTLED = "settled"
@@ -16,6 +22,10 @@ class TransactionStatus(str, Enum):
     REFUNDED = "refunded"
 
 
+# Validated as a plain string membership check, with no Enum instance per model
+TransactionStatusValue = Literal["pending", "settled", "failed", "refunded"]
+
+
 class Transaction(BaseModel):
     """Transaction model"""
 
@@ -23,7 +33,7 @@ class Transaction(BaseModel):
     merchant_id: str = Field(alias="merchantId")
     amount: str
     currency: str = "ZEC"
-    status: TransactionStatus
+    status: TransactionStatusValue
     payment_intent_id: str = Field(alias="paymentIntentId")
     resource_url: str = Field(alias="resourceUrl")
     from_address: Optional[str] = Field(default=None, alias="fromAddress")
@@ -37,8 +47,18 @@ class Transaction(BaseModel):
     created_at: datetime = Field(alias="createdAt")
     updated_at: datetime = Field(alias="updatedAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
+
+    @cached_property
+    def display_row(self) -> Tuple[str, str, str, str]:
+        """Short ID, amount, status and trimmed resource URL, formatted once for display"""
+        url = self.resource_url
+        return (
+            self.id[:12] + "...",
+            f"{self.amount} {self.currency}",
+            self.status,
+            url if len(url) <= 30 else url[:30] + "...",
+        )
 
 
 class ListTransactionsParams(BaseModel):
@@ -51,8 +71,7 @@ class ListTransactionsParams(BaseModel):
     date_to: Optional[str] = Field(default=None, alias="dateTo")
     resource: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class ListTransactionsResponse(BaseModel):
@@ -62,8 +81,7 @@ class ListTransactionsResponse(BaseModel):
     total: int
     has_more: bool = Field(alias="hasMore")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class RefundParams(BaseModel):
@@ -1,23 +1,34 @@
 """Webhook models"""
 
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from z402.models.transaction import Transaction
 
 
 class WebhookEvent(BaseModel):
-    """Webhook event model"""
+    """
+    Webhook event model.
+
+    `payload` holds the raw event data; handlers that only route on `type`
+    or `id` never pay for validating it. `data` is the payload parsed as a
+    Transaction, validated on first access.
+    """
 
     id: str
     type: str
-    data: Transaction
+    payload: Dict[str, Any] = Field(alias="data")
     created_at: datetime = Field(alias="createdAt")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
+
+    @cached_property
+    def data(self) -> Transaction:
+        """The event payload validated as a Transaction"""
+        return Transaction.model_validate(self.payload)
 
 
 class WebhookConfig(BaseModel):
@@ -28,8 +39,7 @@ class WebhookConfig(BaseModel):
     events: List[str]
     enabled: bool
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class UpdateWebhookParams(BaseModel):
@@ -38,5 +48,4 @@ class UpdateWebhookParams(BaseModel):
     webhook_url: str = Field(alias="webhookUrl")
     events: Optional[List[str]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
@@ -1,6 +1,7 @@
 """Payments resource"""
 
-from typing import TYPE_CHECKING
+import asyncio
+from typing import TYPE_CHECKING, Iterable, List
 
 from z402.models.payment import CreatePaymentIntentParams, PaymentIntent, PaymentParams
 
@@ -39,8 +40,44 @@ class PaymentsResource:
             )
             ```
         """
-        data = await self._http.post("/payment-intents", body=params.model_dump(by_alias=True))
-        return PaymentIntent(**data)
+        raw = await self._http.post_json(
+            "/payment-intents", params.model_dump_json(by_alias=True).encode()
+        )
+        return PaymentIntent.model_validate_json(raw)
+
+    async def create_many(
+        self,
+        params: Iterable[CreatePaymentIntentParams],
+        concurrency: int = 10,
+    ) -> List[PaymentIntent]:
+        """
+        Create several payment intents concurrently.
+
+        The API has no bulk endpoint, so the intents are created with
+        parallel requests, at most `concurrency` in flight at once.
+
+        Args:
+            params: Parameters for each payment intent
+            concurrency: Maximum number of concurrent requests (default: 10)
+
+        Returns:
+            Created payment intents, in the same order as params
+
+        Example:
+            ```python
+            intents = await client.payments.create_many([
+                CreatePaymentIntentParams(amount="0.01", resource="/api/a"),
+                CreatePaymentIntentParams(amount="0.02", resource="/api/b"),
+            ])
+            ```
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def create_one(item: CreatePaymentIntentParams) -> PaymentIntent:
+            async with semaphore:
+                return await self.create(item)
+
+        return list(await asyncio.gather(*(create_one(item) for item in params)))
 
     async def get(self, payment_id: str) -> PaymentIntent:
         """
@@ -57,8 +94,8 @@ class PaymentsResource:
             intent = await client.payments.get("pi_...")
             ```
         """
-        data = await self._http.get(f"/payment-intents/{payment_id}")
-        return PaymentIntent(**data)
+        raw = await self._http.get_raw(f"/payment-intents/{payment_id}")
+        return PaymentIntent.model_validate_json(raw)
 
     async def pay(self, payment_id: str, params: PaymentParams) -> PaymentIntent:
         """
@@ -79,11 +116,12 @@ class PaymentsResource:
             )
             ```
         """
-        data = await self._http.post(
+        raw = await self._http.post_json(
             f"/payment-intents/{payment_id}/pay",
-            body=params.model_dump(by_alias=True)
+            params.model_dump_json(by_alias=True).encode(),
         )
-        return PaymentIntent(**data)
+        self._http.invalidate(f"/payment-intents/{payment_id}")
+        return PaymentIntent.model_validate_json(raw)
 
     async def verify(self, payment_id: str) -> PaymentIntent:
         """
@@ -103,8 +141,9 @@ class PaymentsResource:
                 pass
             ```
         """
-        data = await self._http.get(f"/payment-intents/{payment_id}/verify")
-        return PaymentIntent(**data)
+        # Never cached: callers poll this to see settlement as it happens
+        raw = await self._http.request_raw("GET", f"/payment-intents/{payment_id}/verify")
+        return PaymentIntent.model_validate_json(raw)
 
     async def cancel(self, payment_id: str) -> PaymentIntent:
         """
@@ -121,5 +160,6 @@ class PaymentsResource:
             await client.payments.cancel("pi_...")
             ```
         """
-        data = await self._http.post(f"/payment-intents/{payment_id}/cancel")
-        return PaymentIntent(**data)
+        raw = await self._http.post_json(f"/payment-intents/{payment_id}/cancel")
+        self._http.invalidate(f"/payment-intents/{payment_id}")
+        return PaymentIntent.model_validate_json(raw)
@@ -1,6 +1,15 @@
 """Transactions resource"""
 
-from typing import TYPE_CHECKING, List
+import asyncio
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List
+
+from pydantic import TypeAdapter
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
 from z402.models.transaction import (
     ListTransactionsParams,
@@ -8,11 +17,24 @@ from z402.models.transaction import (
     RefundParams,
     Transaction,
 )
+from z402.utils.serialization import loads
 
 if TYPE_CHECKING:
     from z402.utils.http import AsyncHTTPClient
 
 
+def _dump_params(params: ListTransactionsParams | None) -> Dict[str, Any]:
+    """Query parameters for a transaction listing, without None values"""
+    if params is None:
+        return {}
+    # Same output as model_dump(by_alias=True, exclude_none=True), calling the
+    # pydantic-core serializer directly to skip model_dump's Python wrapper
+    query: Dict[str, Any] = params.__pydantic_serializer__.to_python(
+        params, by_alias=True, exclude_none=True
+    )
+    return query
+
+
 class TransactionsResource:
     """
     Transactions API resource.
@@ -20,6 +42,9 @@ class TransactionsResource:
     Provides methods for listing, retrieving, and managing transactions.
     """
 
+    # Validates a whole list in one pydantic-core call, built once per process
+    _TRANSACTION_LIST = TypeAdapter(List[Transaction])
+
     def __init__(self, http: "AsyncHTTPClient") -> None:
         self._http = http
 
@@ -49,9 +74,55 @@ class TransactionsResource:
                 print(f"{tx.id}: {tx.amount} ZEC")
             ```
         """
-        query = params.model_dump(by_alias=True, exclude_none=True) if params else {}
-        data = await self._http.get("/transactions", query=query)
-        return ListTransactionsResponse(**data)
+        query = _dump_params(params)
+        raw = await self._http.get_raw("/transactions", query=query)
+        return ListTransactionsResponse.model_validate_json(raw)
+
+    async def list_all(
+        self, params: ListTransactionsParams | None = None, concurrency: int = 4
+    ) -> List[Transaction]:
+        """
+        List every transaction matching the query, across all pages.
+
+        The first page reveals the total; the remaining pages are then
+        fetched in parallel, at most `concurrency` at a time.
+
+        Args:
+            params: Query parameters; `limit` sets the page size
+            concurrency: Maximum number of concurrent page requests (default: 4)
+
+        Returns:
+            All matching transactions, in page order
+
+        Example:
+            ```python
+            transactions = await client.transactions.list_all(
+                ListTransactionsParams(status=TransactionStatus.SETTLED)
+            )
+            ```
+        """
+        params = params or ListTransactionsParams()
+        first = await self.list(params)
+
+        page_size = params.limit or len(first.transactions)
+        if not first.has_more or not page_size:
+            return list(first.transactions)
+
+        start = (params.offset or 0) + page_size
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(offset: int) -> ListTransactionsResponse:
+            async with semaphore:
+                return await self.list(params.model_copy(update={"offset": offset}))
+
+        pages = await asyncio.gather(
+            *(fetch_page(offset) for offset in range(start, first.total, page_size))
+        )
+
+        transactions = list(first.transactions)
+        for page in pages:
+            transactions.extend(page.transactions)
+        return transactions
 
     async def get(self, transaction_id: str) -> Transaction:
         """
@@ -69,8 +140,8 @@ class TransactionsResource:
             print(tx.status, tx.amount)
             ```
         """
-        data = await self._http.get(f"/transactions/{transaction_id}")
-        return Transaction(**data)
+        raw = await self._http.get_raw(f"/transactions/{transaction_id}")
+        return Transaction.model_validate_json(raw)
 
     async def refund(
         self, transaction_id: str, params: RefundParams | None = None
@@ -93,9 +164,11 @@ class TransactionsResource:
             )
             ```
         """
-        body = params.model_dump(by_alias=True) if params else {}
-        data = await self._http.post(f"/transactions/{transaction_id}/refund", body=body)
-        return Transaction(**data)
+        body = params.model_dump_json(by_alias=True).encode() if params else None
+        raw = await self._http.post_json(f"/transactions/{transaction_id}/refund", body)
+        # A refund changes the transaction and any list or export containing it
+        self._http.invalidate("/transactions")
+        return Transaction.model_validate_json(raw)
 
     async def export_csv(self, params: ListTransactionsParams | None = None) -> str:
         """
@@ -120,9 +193,36 @@ class TransactionsResource:
                 f.write(csv)
             ```
         """
-        query = params.model_dump(by_alias=True, exclude_none=True) if params else {}
-        data = await self._http.get("/transactions/export/csv", query=query)
-        return data["csv"]
+        chunks = [chunk async for chunk in self.export_csv_stream(params)]
+        return b"".join(chunks).decode("utf-8")
+
+    async def export_csv_stream(
+        self, params: ListTransactionsParams | None = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Export transactions to CSV, streaming the file in chunks.
+
+        Memory use stays constant regardless of export size; prefer this
+        over `export_csv` for large date ranges.
+
+        Args:
+            params: Query parameters
+
+        Yields:
+            Chunks of the CSV file as bytes
+
+        Example:
+            ```python
+            with open("transactions.csv", "wb") as f:
+                async for chunk in client.transactions.export_csv_stream(
+                    ListTransactionsParams(date_from="2025-01-01")
+                ):
+                    f.write(chunk)
+            ```
+        """
+        query = _dump_params(params)
+        async for chunk in self._http.stream("GET", "/transactions/export/csv", query=query):
+            yield chunk
 
     async def export_json(self, params: ListTransactionsParams | None = None) -> List[Transaction]:
         """
@@ -141,6 +241,55 @@ class TransactionsResource:
             )
             ```
         """
-        query = params.model_dump(by_alias=True, exclude_none=True) if params else {}
+        query = _dump_params(params)
         data = await self._http.get("/transactions/export/json", query=query)
-        return [Transaction(**tx) for tx in data["transactions"]]
+        return self._TRANSACTION_LIST.validate_python(data["transactions"])
+
+    async def iter_export_json(
+        self, params: ListTransactionsParams | None = None
+    ) -> AsyncIterator[Transaction]:
+        """
+        Export transactions to JSON, yielding each one as it arrives.
+
+        With ijson installed (`pip install z402-sdk[streaming]`), the
+        response is parsed incrementally, so memory stays constant and the
+        first transaction is available before the download finishes.
+        Without it, the response is buffered and parsed in one go.
+
+        Args:
+            params: Query parameters
+
+        Yields:
+            Transactions, in export order
+
+        Example:
+            ```python
+            async for tx in client.transactions.iter_export_json(
+                ListTransactionsParams(date_from="2025-01-01")
+            ):
+                print(tx.id, tx.amount)
+            ```
+        """
+        query = _dump_params(params)
+        chunks = self._http.stream("GET", "/transactions/export/json", query=query)
+
+        if not IJSON_AVAILABLE:
+            data = loads(b"".join([chunk async for chunk in chunks]))
+            for tx in self._TRANSACTION_LIST.validate_python(data["transactions"]):
+                yield tx
+            return
+
+        # Push each chunk into ijson, then validate the transactions it
+        # completed as one batch. use_float matches the fallback's parsing:
+        # ijson otherwise yields Decimal for non-integer numbers
+        items = ijson.sendable_list()
+        parser = ijson.items_coro(items, "transactions.item", use_float=True)
+        async for chunk in chunks:
+            parser.send(chunk)
+            if items:
+                for tx in self._TRANSACTION_LIST.validate_python(items):
+                    yield tx
+                del items[:]
+        parser.close()
+        for tx in self._TRANSACTION_LIST.validate_python(items):
+            yield tx
@@ -32,7 +32,7 @@ class WebhooksResource:
             ```
         """
         data = await self._http.get("/webhook-management")
-        return WebhookConfig(**data)
+        return WebhookConfig.model_validate(data)
 
     async def update(self, params: UpdateWebhookParams) -> WebhookConfig:
         """
@@ -55,7 +55,8 @@ class WebhooksResource:
             ```
         """
         data = await self._http.put("/webhook-management", body=params.model_dump(by_alias=True))
-        return WebhookConfig(**data)
+        self._http.invalidate("/webhook-management")
+        return WebhookConfig.model_validate(data)
 
     async def delete(self) -> None:
         """
@@ -67,6 +68,7 @@ class WebhooksResource:
             ```
         """
         await self._http.delete("/webhook-management")
+        self._http.invalidate("/webhook-management")
 
     async def test(self) -> Dict[str, Any]:
         """
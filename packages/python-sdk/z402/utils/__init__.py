@@ -1,14 +1,51 @@
 """Z402 SDK Utilities"""
 
-from z402.utils.budget import BudgetManager
-from z402.utils.http import AsyncHTTPClient
-from z402.utils.retry import retry_with_backoff
-from z402.utils.webhook import construct_webhook_signature, verify_webhook
+import importlib
+from typing import TYPE_CHECKING, Any
+
+# Imported on first access (PEP 562) so that importing one utility, e.g.
+# the webhook helpers, doesn't load aiohttp via the HTTP client
+_EXPORTS = {
+    "AsyncHTTPClient": "z402.utils.http",
+    "BudgetManager": "z402.utils.budget",
+    "construct_webhook_signature": "z402.utils.webhook",
+    "make_verifier": "z402.utils.webhook",
+    "retry_with_backoff": "z402.utils.retry",
+    "use_fast_event_loop": "z402.utils.loop",
+    "verify_webhook": "z402.utils.webhook",
+    "WebhookVerifier": "z402.utils.webhook",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+if TYPE_CHECKING:
+    from z402.utils.budget import BudgetManager
+    from z402.utils.http import AsyncHTTPClient
+    from z402.utils.loop import use_fast_event_loop
+    from z402.utils.retry import retry_with_backoff
+    from z402.utils.webhook import (
+        WebhookVerifier,
+        construct_webhook_signature,
+        make_verifier,
+        verify_webhook,
+    )
 
 __all__ = [
     "AsyncHTTPClient",
     "retry_with_backoff",
     "verify_webhook",
     "construct_webhook_signature",
+    "make_verifier",
+    "WebhookVerifier",
     "BudgetManager",
+    "use_fast_event_loop",
 ]
@@ -1,11 +1,21 @@
 """Budget management for AI agents"""
 
 import asyncio
-from datetime import datetime, timedelta
+import itertools
+import time
+from collections import deque
+from datetime import datetime
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
 
 from z402.exceptions import BudgetExceededError
+from z402.utils.units import zat_to_zec, zec_to_zat
+
+_HOUR = 3600.0
+_DAY = 86400.0
+
+# Most recent transactions kept for get_transaction_history
+_HISTORY_SIZE = 1000
 
 
 class BudgetManager:
@@ -46,8 +56,34 @@ class BudgetManager:
         self.hourly_limit = Decimal(hourly_limit) if hourly_limit else None
         self.transaction_limit = Decimal(transaction_limit) if transaction_limit else None
 
+        self._daily_limit_zat = zec_to_zat(daily_limit)
+        self._hourly_limit_zat = zec_to_zat(hourly_limit) if hourly_limit else None
+        self._txn_limit_zat = zec_to_zat(transaction_limit) if transaction_limit else None
+
         self._lock = asyncio.Lock()
-        self._transactions: List[Dict[str, any]] = []
+
+        # Per-window (expires_at, amount_zat) entries in expiry order, with
+        # running totals so checks never rescan the history
+        self._daily_q: Deque[Tuple[float, int]] = deque()
+        self._hourly_q: Deque[Tuple[float, int]] = deque()
+        self._daily_spent_zat = 0
+        self._hourly_spent_zat = 0
+
+        # (monotonic time, timestamp, amount, transaction_id, metadata); the
+        # monotonic time drives the history window, the datetime is reported
+        self._transactions: Deque[tuple] = deque(maxlen=_HISTORY_SIZE)
+
+    def _expire(self) -> None:
+        """Drop window entries that have aged out (caller holds the lock)"""
+        now = time.monotonic()
+
+        daily_q = self._daily_q
+        while daily_q and daily_q[0][0] <= now:
+            self._daily_spent_zat -= daily_q.popleft()[1]
+
+        hourly_q = self._hourly_q
+        while hourly_q and hourly_q[0][0] <= now:
+            self._hourly_spent_zat -= hourly_q.popleft()[1]
 
     async def can_spend(self, amount: str) -> bool:
         """
@@ -59,39 +95,29 @@ class BudgetManager:
         Returns:
             True if within budget limits
         """
-        spend_amount = Decimal(amount)
+        spend_zat = zec_to_zat(amount)
 
         # Check transaction limit
-        if self.transaction_limit and spend_amount > self.transaction_limit:
+        if self._txn_limit_zat and spend_zat > self._txn_limit_zat:
             return False
 
         async with self._lock:
-            now = datetime.now()
-
-            # Calculate daily spending
-            daily_start = now - timedelta(days=1)
-            daily_spent = sum(
-                Decimal(tx["amount"])
-                for tx in self._transactions
-                if tx["timestamp"] >= daily_start
-            )
+            self._expire()
+            return self._can_spend_locked(spend_zat)
 
-            if daily_spent + spend_amount > self.daily_limit:
-                return False
-
-            # Calculate hourly spending (if limit set)
-            if self.hourly_limit:
-                hourly_start = now - timedelta(hours=1)
-                hourly_spent = sum(
-                    Decimal(tx["amount"])
-                    for tx in self._transactions
-                    if tx["timestamp"] >= hourly_start
-                )
+    def _can_spend_locked(self, spend_zat: int) -> bool:
+        """Check the window limits (caller holds the lock and has expired entries)"""
+        if self._daily_spent_zat + spend_zat > self._daily_limit_zat:
+            return False
 
-                if hourly_spent + spend_amount > self.hourly_limit:
-                    return False
+        # Check hourly spending (if limit set)
+        if (
+            self._hourly_limit_zat
+            and self._hourly_spent_zat + spend_zat > self._hourly_limit_zat
+        ):
+            return False
 
-            return True
+        return True
 
     async def record_spend(
         self,
@@ -110,20 +136,83 @@ class BudgetManager:
         Raises:
             BudgetExceededError: If spending would exceed limits
         """
-        if not await self.can_spend(amount):
-            raise BudgetExceededError(
-                "Spending would exceed budget limits",
-                limit=str(self.daily_limit),
-                current=str(await self.get_daily_spent()),
-            )
+        # Build the entries up front so the lock only covers the check and
+        # the mutations
+        spend_zat = zec_to_zat(amount)
+        now = time.monotonic()
+        daily_entry = (now + _DAY, spend_zat)
+        hourly_entry = (now + _HOUR, spend_zat)
+        record = (now, datetime.now(), amount, transaction_id, metadata or {})
+
+        within_txn_limit = not self._txn_limit_zat or spend_zat <= self._txn_limit_zat
+
+        # Check and record in one critical section, so concurrent spends
+        # can't both pass the check and overshoot the limit together
+        async with self._lock:
+            self._expire()
+
+            if not within_txn_limit or not self._can_spend_locked(spend_zat):
+                raise BudgetExceededError(
+                    "Spending would exceed budget limits",
+                    limit=str(self.daily_limit),
+                    current=str(zat_to_zec(self._daily_spent_zat)),
+                )
+
+            self._daily_q.append(daily_entry)
+            self._hourly_q.append(hourly_entry)
+            self._daily_spent_zat += spend_zat
+            self._hourly_spent_zat += spend_zat
+            self._transactions.append(record)
+
+    async def reserve(self, amounts: Iterable[str]) -> List["BudgetReservation"]:
+        """
+        Hold budget for several spends before paying for any of them.
+
+        The whole batch is checked and added to the spending windows in one
+        critical section, so a concurrent spend can't slip in between the
+        check and the payments. Each returned reservation must then be
+        recorded once its payment succeeds, or released if it fails.
+
+        Args:
+            amounts: Amounts to reserve in ZEC
+
+        Returns:
+            One reservation per amount, in the same order
+
+        Raises:
+            BudgetExceededError: If the batch would exceed limits
+        """
+        amounts = list(amounts)
+        spends_zat = [zec_to_zat(amount) for amount in amounts]
+        total_zat = sum(spends_zat)
+        now = time.monotonic()
+
+        within_txn_limit = not self._txn_limit_zat or all(
+            spend_zat <= self._txn_limit_zat for spend_zat in spends_zat
+        )
 
         async with self._lock:
-            self._transactions.append({
-                "amount": amount,
-                "transaction_id": transaction_id,
-                "timestamp": datetime.now(),
-                "metadata": metadata or {},
-            })
+            self._expire()
+
+            if not within_txn_limit or not self._can_spend_locked(total_zat):
+                raise BudgetExceededError(
+                    "Spending would exceed budget limits",
+                    limit=str(self.daily_limit),
+                    current=str(zat_to_zec(self._daily_spent_zat)),
+                )
+
+            reservations = []
+            for amount, spend_zat in zip(amounts, spends_zat):
+                daily_entry = (now + _DAY, spend_zat)
+                hourly_entry = (now + _HOUR, spend_zat)
+                self._daily_q.append(daily_entry)
+                self._hourly_q.append(hourly_entry)
+                reservations.append(BudgetReservation(self, amount, daily_entry, hourly_entry))
+
+            self._daily_spent_zat += total_zat
+            self._hourly_spent_zat += total_zat
+
+        return reservations
 
     async def get_daily_spent(self) -> Decimal:
         """
@@ -133,14 +222,9 @@ class BudgetManager:
             Total amount spent
         """
         async with self._lock:
-            now = datetime.now()
-            daily_start = now - timedelta(days=1)
-
-            return sum(
-                Decimal(tx["amount"])
-                for tx in self._transactions
-                if tx["timestamp"] >= daily_start
-            )
+            self._expire()
+            spent = self._daily_spent_zat
+        return zat_to_zec(spent)
 
     async def get_hourly_spent(self) -> Decimal:
         """
@@ -150,14 +234,9 @@ class BudgetManager:
             Total amount spent
         """
         async with self._lock:
-            now = datetime.now()
-            hourly_start = now - timedelta(hours=1)
-
-            return sum(
-                Decimal(tx["amount"])
-                for tx in self._transactions
-                if tx["timestamp"] >= hourly_start
-            )
+            self._expire()
+            spent = self._hourly_spent_zat
+        return zat_to_zec(spent)
 
     async def get_remaining_daily(self) -> Decimal:
         """
@@ -185,24 +264,41 @@ class BudgetManager:
         """
         Get transaction history for the specified time period.
 
+        Only the most recent 1000 transactions are retained.
+
         Args:
             hours: Number of hours to look back
 
         Returns:
             List of transactions
         """
+        cutoff = time.monotonic() - hours * _HOUR
+
+        # History is appended in time order, so walk back from the newest
+        # entry and stop at the first one older than the cutoff
         async with self._lock:
-            cutoff = datetime.now() - timedelta(hours=hours)
-            return [
-                tx
-                for tx in self._transactions
-                if tx["timestamp"] >= cutoff
-            ]
+            recent = list(
+                itertools.takewhile(lambda entry: entry[0] >= cutoff, reversed(self._transactions))
+            )
+
+        return [
+            {
+                "amount": amount,
+                "transaction_id": transaction_id,
+                "timestamp": timestamp,
+                "metadata": metadata,
+            }
+            for _, timestamp, amount, transaction_id, metadata in reversed(recent)
+        ]
 
     async def reset_history(self) -> None:
         """Clear transaction history"""
         async with self._lock:
             self._transactions.clear()
+            self._daily_q.clear()
+            self._hourly_q.clear()
+            self._daily_spent_zat = 0
+            self._hourly_spent_zat = 0
 
     async def get_statistics(self) -> Dict[str, any]:
         """
@@ -211,25 +307,96 @@ class BudgetManager:
         Returns:
             Dictionary with budget stats
         """
-        daily_spent = await self.get_daily_spent()
-        hourly_spent = await self.get_hourly_spent()
+        async with self._lock:
+            self._expire()
+            daily_spent = self._daily_spent_zat
+            hourly_spent = self._hourly_spent_zat
 
         stats = {
             "daily_limit": str(self.daily_limit),
-            "daily_spent": str(daily_spent),
-            "daily_remaining": str(self.daily_limit - daily_spent),
-            "daily_usage_percent": float((daily_spent / self.daily_limit) * 100),
+            "daily_spent": str(zat_to_zec(daily_spent)),
+            "daily_remaining": str(zat_to_zec(self._daily_limit_zat - daily_spent)),
+            "daily_remaining_zat": self._daily_limit_zat - daily_spent,
+            "daily_usage_percent": daily_spent * 100 / self._daily_limit_zat,
         }
 
-        if self.hourly_limit:
+        if self._hourly_limit_zat:
             stats.update({
                 "hourly_limit": str(self.hourly_limit),
-                "hourly_spent": str(hourly_spent),
-                "hourly_remaining": str(self.hourly_limit - hourly_spent),
-                "hourly_usage_percent": float((hourly_spent / self.hourly_limit) * 100),
+                "hourly_spent": str(zat_to_zec(hourly_spent)),
+                "hourly_remaining": str(zat_to_zec(self._hourly_limit_zat - hourly_spent)),
+                "hourly_remaining_zat": self._hourly_limit_zat - hourly_spent,
+                "hourly_usage_percent": hourly_spent * 100 / self._hourly_limit_zat,
             })
 
         if self.transaction_limit:
             stats["transaction_limit"] = str(self.transaction_limit)
 
         return stats
+
+
+class BudgetReservation:
+    """
+    Budget held by `BudgetManager.reserve` for a spend that isn't paid yet.
+
+    Call `record` once the payment succeeds, or `release` to give the
+    budget back if it fails.
+    """
+
+    def __init__(
+        self,
+        budget: BudgetManager,
+        amount: str,
+        daily_entry: Tuple[float, int],
+        hourly_entry: Tuple[float, int],
+    ) -> None:
+        self.amount = amount
+        self._budget = budget
+        self._daily_entry = daily_entry
+        self._hourly_entry = hourly_entry
+        self._settled = False
+
+    async def record(
+        self,
+        transaction_id: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Record the reserved spend in the transaction history.
+
+        Args:
+            transaction_id: Transaction ID
+            metadata: Optional metadata
+        """
+        budget = self._budget
+        record = (time.monotonic(), datetime.now(), self.amount, transaction_id, metadata or {})
+
+        async with budget._lock:
+            if self._settled:
+                return
+            self._settled = True
+            budget._transactions.append(record)
+
+    async def release(self) -> None:
+        """Return the reserved amount to the budget"""
+        budget = self._budget
+
+        async with budget._lock:
+            if self._settled:
+                return
+            self._settled = True
+
+            # The entries may already have aged out of a window, in which
+            # case _expire has taken them off the total
+            budget._expire()
+            spend_zat = self._daily_entry[1]
+            try:
+                budget._daily_q.remove(self._daily_entry)
+                budget._daily_spent_zat -= spend_zat
+            except ValueError:
+                pass
+            try:
+                budget._hourly_q.remove(self._hourly_entry)
+                budget._hourly_spent_zat -= spend_zat
+            except ValueError:
+                pass
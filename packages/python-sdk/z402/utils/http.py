@@ -1,11 +1,19 @@
 """Async HTTP client with retry logic"""
 
 import asyncio
-from typing import Any, Dict, Optional
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Mapping, Optional, Tuple
 from urllib.parse import urlencode
 
 import aiohttp
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 from z402.exceptions import (
     APIError,
     AuthenticationError,
@@ -16,6 +24,17 @@ from z402.exceptions import (
     RateLimitError,
 )
 from z402.utils.retry import retry_with_backoff
+from z402.utils.serialization import dumps, loads
+
+if HTTPX_AVAILABLE:
+    _TIMEOUT_ERRORS: tuple = (asyncio.TimeoutError, httpx.TimeoutException)
+    _TRANSPORT_ERRORS: tuple = (aiohttp.ClientError, httpx.TransportError)
+else:
+    _TIMEOUT_ERRORS = (asyncio.TimeoutError,)
+    _TRANSPORT_ERRORS = (aiohttp.ClientError,)
+
+# Most GET responses kept when cache_ttl is set
+_CACHE_MAX_ENTRIES = 1024
 
 
 class AsyncHTTPClient:
@@ -28,6 +47,20 @@ class AsyncHTTPClient:
         max_retries: Maximum number of retry attempts
         timeout: Request timeout in seconds
         debug: Enable debug logging
+        http2: Use HTTP/2 via httpx, so concurrent requests are multiplexed
+            over one connection (requires `pip install z402-sdk[http2]`)
+        pool_size: Maximum number of open connections
+        pool_size_per_host: Maximum connections per host (0 for no per-host
+            limit; aiohttp transport only)
+        cache_ttl: Seconds to cache GET responses for (0 disables caching)
+
+    Connections are pooled and kept alive per instance, so share one client
+    across the application rather than creating one per task.
+
+    With `cache_ttl` set, repeated GETs for the same path and query are
+    served from memory until they expire or `invalidate()` drops them.
+    Concurrent identical GETs share one request either way, so returned
+    dicts may be shared between callers and must not be mutated.
     """
 
     def __init__(
@@ -37,13 +70,41 @@ class AsyncHTTPClient:
         max_retries: int = 3,
         timeout: int = 30,
         debug: bool = False,
+        http2: bool = False,
+        pool_size: int = 100,
+        pool_size_per_host: int = 0,
+        cache_ttl: float = 0,
     ) -> None:
+        if http2 and not HTTPX_AVAILABLE:
+            raise ImportError(
+                "HTTP/2 support requires httpx. Install with: pip install z402-sdk[http2]"
+            )
+
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.max_retries = max_retries
         self.timeout = timeout
         self.debug = debug
+        self.http2 = http2
+        self.pool_size = pool_size
+        self.pool_size_per_host = pool_size_per_host
+        # Sent on every request; shared rather than rebuilt each time. The
+        # transports copy headers into their own structures, so this is
+        # never mutated
+        self._base_headers: Dict[str, str] = {
+            "Content-Type": "application/json",
+            "X-API-Key": api_key,
+            "User-Agent": "z402-python-sdk/0.1.0",
+        }
+        self.cache_ttl = cache_ttl
+        # (raw, path, query) -> (expires_at, response), least recently used first
+        self._cache: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+        # Bumped by invalidate(), so a fetch that started before it isn't cached
+        self._cache_generation = 0
+        # GETs currently in flight, shared by concurrent identical calls
+        self._inflight: Dict[tuple, "asyncio.Future[Any]"] = {}
         self._session: Optional[aiohttp.ClientSession] = None
+        self._httpx: Optional["httpx.AsyncClient"] = None
 
     async def __aenter__(self) -> "AsyncHTTPClient":
         """Async context manager entry"""
@@ -55,57 +116,70 @@ class AsyncHTTPClient:
         await self.close()
 
     async def _ensure_session(self) -> None:
-        """Ensure aiohttp session exists"""
-        if self._session is None or self._session.closed:
+        """Ensure the HTTP session exists"""
+        if self.http2:
+            if self._httpx is None or self._httpx.is_closed:
+                self._httpx = httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=self.pool_size,
+                        max_keepalive_connections=self.pool_size,
+                    ),
+                    timeout=httpx.Timeout(self.timeout),
+                )
+        elif self._session is None or self._session.closed:
             timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+            # The session owns the connector, so closing it closes the pool
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.pool_size_per_host,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            )
+            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
 
     async def close(self) -> None:
         """Close the HTTP session"""
         if self._session and not self._session.closed:
             await self._session.close()
+        if self._httpx and not self._httpx.is_closed:
+            await self._httpx.aclose()
 
     def _build_url(self, path: str, query: Optional[Dict[str, Any]] = None) -> str:
-        """Build full URL with query parameters"""
+        """Build full URL with query parameters (None values already dropped by the caller)"""
         url = f"{self.base_url}{path}"
         if query:
-            # Filter out None values
-            filtered_query = {k: v for k, v in query.items() if v is not None}
-            if filtered_query:
-                url += f"?{urlencode(filtered_query)}"
+            url += f"?{urlencode(query)}"
         return url
 
     def _build_headers(self, custom_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """Build request headers"""
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": self.api_key,
-            "User-Agent": "z402-python-sdk/0.1.0",
-        }
-        if custom_headers:
-            headers.update(custom_headers)
-        return headers
+        if not custom_headers:
+            return self._base_headers
+        return {**self._base_headers, **custom_headers}
 
-    async def _handle_response(self, response: aiohttp.ClientResponse) -> Dict[str, Any]:
+    def _handle_response(
+        self, status: int, headers: Mapping[str, str], raw: bytes
+    ) -> Dict[str, Any]:
         """Handle API response and errors"""
         try:
-            data = await response.json()
-        except Exception:
-            text = await response.text()
+            data = loads(raw)
+        except ValueError:
+            text = raw.decode("utf-8", errors="replace")
             data = {"message": text} if text else {}
 
         if self.debug and data:
             print(f"[Z402 SDK] Response data: {data}")
 
-        if not response.ok:
+        if status >= 400:
             message = data.get("error", {}).get("message") or data.get("message") or "API error"
             details = data.get("error", {}).get("details") or data.get("details")
 
-            if response.status == 401:
+            if status == 401:
                 raise AuthenticationError(message, details=details)
-            elif response.status == 400:
+            elif status == 400:
                 raise InvalidRequestError(message, details=details)
-            elif response.status == 402:
+            elif status == 402:
                 payment_info = data.get("payment", {})
                 raise PaymentRequiredError(
                     message,
@@ -113,20 +187,59 @@ class AsyncHTTPClient:
                     resource=payment_info.get("resource"),
                     details=details,
                 )
-            elif response.status == 404:
+            elif status == 404:
                 raise NotFoundError(message, details=details)
-            elif response.status == 429:
-                retry_after = response.headers.get("retry-after")
+            elif status == 429:
+                retry_after = headers.get("retry-after")
                 raise RateLimitError(
                     message,
                     retry_after=int(retry_after) if retry_after else None,
                     details=details,
                 )
             else:
-                raise APIError(message, status_code=response.status, details=details)
+                raise APIError(message, status_code=status, details=details)
 
         return data
 
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        content: Optional[bytes],
+        headers: Dict[str, str],
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        """Send a request on the active transport and read the whole response"""
+        await self._ensure_session()
+
+        try:
+            if self.http2:
+                response = await self._httpx.request(  # type: ignore
+                    method, url, content=content, headers=headers
+                )
+                status, response_headers, raw = (
+                    response.status_code, response.headers, response.content
+                )
+            else:
+                async with self._session.request(  # type: ignore
+                    method=method,
+                    url=url,
+                    data=content,
+                    headers=headers,
+                ) as response:
+                    status, response_headers, raw = (
+                        response.status, response.headers, await response.read()
+                    )
+
+        except _TIMEOUT_ERRORS:
+            raise NetworkError("Request timeout")
+        except _TRANSPORT_ERRORS as error:
+            raise NetworkError(str(error), details=error)
+
+        if self.debug:
+            print(f"[Z402 SDK] Response {status}")
+
+        return status, response_headers, raw
+
     @retry_with_backoff()
     async def request(
         self,
@@ -143,7 +256,7 @@ class AsyncHTTPClient:
             method: HTTP method
             path: API endpoint path
             body: Request body (for POST, PUT, PATCH)
-            query: Query parameters
+            query: Query parameters, without None values
             headers: Custom headers
 
         Returns:
@@ -153,38 +266,214 @@ class AsyncHTTPClient:
             Z402Error: On API errors
             NetworkError: On network failures
         """
-        await self._ensure_session()
-
         url = self._build_url(path, query)
-        request_headers = self._build_headers(headers)
 
         if self.debug:
             print(f"[Z402 SDK] {method} {url}")
             if body:
                 print(f"[Z402 SDK] Request body: {body}")
 
+        content = dumps(body) if body else None
+        status, response_headers, raw = await self._send(
+            method, url, content, self._build_headers(headers)
+        )
+        return self._handle_response(status, response_headers, raw)
+
+    @retry_with_backoff()
+    async def request_raw(
+        self,
+        method: str,
+        path: str,
+        content: Optional[bytes] = None,
+        query: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> bytes:
+        """
+        Make HTTP request with retry logic, sending and returning raw JSON bytes.
+
+        Lets callers serialize and parse bodies themselves (e.g. straight
+        to and from pydantic models) without an intermediate dict.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            content: Pre-serialized JSON request body
+            query: Query parameters, without None values
+            headers: Custom headers
+
+        Returns:
+            Raw response body
+
+        Raises:
+            Z402Error: On API errors
+            NetworkError: On network failures
+        """
+        url = self._build_url(path, query)
+
+        if self.debug:
+            print(f"[Z402 SDK] {method} {url}")
+            if content:
+                print(f"[Z402 SDK] Request body: {content.decode('utf-8', errors='replace')}")
+
+        status, response_headers, raw = await self._send(
+            method, url, content, self._build_headers(headers)
+        )
+
+        if status >= 400:
+            # Parses the error body and raises the matching exception
+            self._handle_response(status, response_headers, raw)
+
+        if self.debug and raw:
+            print(f"[Z402 SDK] Response data: {raw.decode('utf-8', errors='replace')}")
+
+        return raw
+
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        query: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 65536,
+    ) -> AsyncIterator[bytes]:
+        """
+        Make HTTP request and yield the raw response body in chunks.
+
+        Streamed requests are not retried, since a failure partway through
+        would replay chunks the caller has already consumed. The timeout
+        applies to each read rather than the whole transfer.
+
+        Args:
+            method: HTTP method
+            path: API endpoint path
+            query: Query parameters, without None values
+            chunk_size: Maximum size of each yielded chunk in bytes
+
+        Yields:
+            Response body chunks
+
+        Raises:
+            Z402Error: On API errors
+            NetworkError: On network failures
+        """
+        await self._ensure_session()
+
+        url = self._build_url(path, query)
+
+        if self.debug:
+            print(f"[Z402 SDK] {method} {url} (streaming)")
+
         try:
-            async with self._session.request(  # type: ignore
-                method=method,
-                url=url,
-                json=body if body else None,
-                headers=request_headers,
-            ) as response:
-                if self.debug:
-                    print(f"[Z402 SDK] Response {response.status}")
-
-                return await self._handle_response(response)
-
-        except asyncio.TimeoutError:
+            if self.http2:
+                async with self._httpx.stream(  # type: ignore
+                    method,
+                    url,
+                    headers=self._build_headers(),
+                ) as response:
+                    if self.debug:
+                        print(f"[Z402 SDK] Response {response.status_code}")
+
+                    if response.status_code >= 400:
+                        raw = await response.aread()
+                        self._handle_response(response.status_code, response.headers, raw)
+
+                    async for chunk in response.aiter_bytes(chunk_size):
+                        yield chunk
+            else:
+                async with self._session.request(  # type: ignore
+                    method=method,
+                    url=url,
+                    headers=self._build_headers(),
+                    timeout=aiohttp.ClientTimeout(total=None, sock_read=self.timeout),
+                ) as response:
+                    if self.debug:
+                        print(f"[Z402 SDK] Response {response.status}")
+
+                    if not response.ok:
+                        raw = await response.read()
+                        self._handle_response(response.status, response.headers, raw)
+
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        yield chunk
+
+        except _TIMEOUT_ERRORS:
             raise NetworkError("Request timeout")
-        except aiohttp.ClientError as error:
+        except _TRANSPORT_ERRORS as error:
             raise NetworkError(str(error), details=error)
 
+    async def _shared_get(
+        self,
+        raw: bool,
+        path: str,
+        query: Optional[Dict[str, Any]],
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Run a GET at most once for concurrent identical calls.
+
+        Callers that arrive while the same request is in flight await its
+        result instead of sending another. With `cache_ttl` set the result
+        is also cached, and served until it expires.
+        """
+        items = tuple(sorted(query.items())) if query else ()
+        key = (raw, path, items)
+
+        if self.cache_ttl:
+            entry = self._cache.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._cache.move_to_end(key)
+                    return entry[1]
+                del self._cache[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded so one caller being cancelled doesn't cancel the request
+        # for everyone else waiting on it
+        return await asyncio.shield(task)
+
+    async def _load(self, key: tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Fetch a GET response and cache it if nothing was invalidated meanwhile"""
+        generation = self._cache_generation
+        value = await fetch()
+
+        if self.cache_ttl and generation == self._cache_generation:
+            self._cache[key] = (time.monotonic() + self.cache_ttl, value)
+            if len(self._cache) > _CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+        return value
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """
+        Drop cached GET responses after a write.
+
+        Args:
+            path: Path whose entries to drop, including paths beneath it
+                (e.g. "/transactions" also drops "/transactions/tx_..."). Drops
+                everything when omitted.
+        """
+        self._cache_generation += 1
+
+        if path is None:
+            self._cache.clear()
+            return
+
+        prefix = path.rstrip("/") + "/"
+        for key in [k for k in self._cache if k[1] == path or k[1].startswith(prefix)]:
+            del self._cache[key]
+
     async def get(
         self, path: str, query: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """GET request"""
-        return await self.request("GET", path, query=query)
+        data: Dict[str, Any] = await self._shared_get(
+            False, path, query, lambda: self.request("GET", path, query=query)
+        )
+        return data
 
     async def post(
         self, path: str, body: Optional[Dict[str, Any]] = None
@@ -192,6 +481,17 @@ class AsyncHTTPClient:
         """POST request"""
         return await self.request("POST", path, body=body)
 
+    async def get_raw(self, path: str, query: Optional[Dict[str, Any]] = None) -> bytes:
+        """GET request returning the raw JSON response body"""
+        raw: bytes = await self._shared_get(
+            True, path, query, lambda: self.request_raw("GET", path, query=query)
+        )
+        return raw
+
+    async def post_json(self, path: str, raw: Optional[bytes] = None) -> bytes:
+        """POST a pre-serialized JSON body, returning the raw JSON response body"""
+        return await self.request_raw("POST", path, content=raw)
+
     async def put(
         self, path: str, body: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -0,0 +1,49 @@
+"""Event loop selection"""
+
+import asyncio
+from typing import Optional
+
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+def new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a new event loop: uvloop's libuv-based loop when installed, stdlib otherwise"""
+    return uvloop.new_event_loop() if UVLOOP_AVAILABLE else asyncio.new_event_loop()
+
+
+def use_fast_event_loop(policy: Optional[asyncio.AbstractEventLoopPolicy] = None) -> bool:
+    """
+    Install a faster event loop policy for the process.
+
+    Call once at startup, before `asyncio.run()` and before constructing a
+    client, since sessions are bound to the loop they were created on. The
+    aiohttp transport works unchanged on any conforming loop.
+
+    Args:
+        policy: Event loop policy to install, for plugging in another loop
+            implementation (e.g. an io_uring-based one). Defaults to uvloop's
+            policy when `pip install z402-sdk[speedups]` is installed.
+
+    Returns:
+        True if a policy was installed, False if the stdlib loop stays in use
+
+    Example:
+        ```python
+        from z402.utils import use_fast_event_loop
+
+        use_fast_event_loop()
+        asyncio.run(main())
+        ```
+    """
+    if policy is None:
+        if not UVLOOP_AVAILABLE:
+            return False
+        policy = uvloop.EventLoopPolicy()
+
+    asyncio.set_event_loop_policy(policy)
+    return True
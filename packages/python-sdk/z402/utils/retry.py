@@ -1,8 +1,9 @@
 """Retry logic with exponential backoff"""
 
 import asyncio
+import random
 from functools import wraps
-from typing import Any, Callable, TypeVar
+from typing import Any, Awaitable, Callable, TypeVar
 
 from z402.exceptions import NetworkError, RateLimitError, Z402Error
 
@@ -40,7 +41,8 @@ def retry_with_backoff(
     initial_delay: float = 1.0,
     max_delay: float = 30.0,
     backoff_multiplier: float = 2.0,
-) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    jitter: bool = True,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
     """
     Decorator for retrying async functions with exponential backoff.
 
@@ -49,6 +51,8 @@ def retry_with_backoff(
         initial_delay: Initial delay in seconds
         max_delay: Maximum delay in seconds
         backoff_multiplier: Multiplier for exponential backoff
+        jitter: Sleep a random time up to the backoff delay ("full jitter"),
+            so clients that failed together don't all retry together
 
     Returns:
         Decorated function
@@ -62,40 +66,37 @@ def retry_with_backoff(
         ```
     """
 
-    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
-            last_error: Exception
+            delay = min(initial_delay, max_delay)
 
-            delay = initial_delay
-
-            for attempt in range(max_retries + 1):
+            for _ in range(max_retries):
                 try:
                     return await func(*args, **kwargs)
                 except Exception as error:
-                    last_error = error
-
                     # Don't retry on non-retryable errors
                     if not is_retryable_error(error):
                         raise
 
-                    # Don't retry if we've exhausted attempts
-                    if attempt == max_retries:
-                        break
-
-                    # Handle rate limit with custom delay
+                    # Handle rate limit with custom delay. The server asked
+                    # for at least this long, so it is never jittered
                     if isinstance(error, RateLimitError) and error.retry_after:
                         delay = min(error.retry_after, max_delay)
+                        sleep_for = delay
+                    elif jitter:
+                        sleep_for = random.uniform(0, delay)
                     else:
-                        delay = min(delay, max_delay)
+                        sleep_for = delay
 
                     # Wait before retrying
-                    await asyncio.sleep(delay)
+                    await asyncio.sleep(sleep_for)
 
-                    # Increase delay for next attempt
-                    delay *= backoff_multiplier
+                    # Increase delay for next attempt, never past max_delay
+                    delay = min(delay * backoff_multiplier, max_delay)
 
-            raise last_error
+            # Final attempt: any error propagates with its original traceback
+            return await func(*args, **kwargs)
 
         return wrapper
 
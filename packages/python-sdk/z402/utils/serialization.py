@@ -0,0 +1,38 @@
+"""JSON serialization helpers, backed by orjson when it is installed"""
+
+import json
+from typing import Any, Type, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# ValueError subclass raised by loads() for malformed input
+JSONDecodeError: Type[ValueError]
+
+if ORJSON_AVAILABLE:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    # catch the stdlib exception regardless of which backend is active
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes"""
+        return orjson.dumps(obj)
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Parse JSON from bytes or str"""
+        return orjson.loads(data)
+
+else:
+    JSONDecodeError = json.JSONDecodeError
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes"""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Parse JSON from bytes or str"""
+        return json.loads(data)
@@ -0,0 +1,39 @@
+"""ZEC amount conversions"""
+
+from decimal import Decimal, InvalidOperation
+from typing import Union
+
+# Zatoshis per ZEC; the zatoshi is the smallest Zcash unit
+ZAT_PER_ZEC = 10**8
+
+_ZAT_PER_ZEC_DECIMAL = Decimal(ZAT_PER_ZEC)
+
+
+def zec_to_zat(amount: Union[str, Decimal]) -> int:
+    """
+    Convert a ZEC amount to integer zatoshis.
+
+    Accepts anything Decimal can parse from its string form, including
+    exponent notation such as "1E-8" (what `str(Decimal("0.00000001"))`
+    produces). Fractions of a zatoshi are truncated.
+
+    Raises:
+        ValueError: If the amount is not a finite number
+
+    Example:
+        ```python
+        zec_to_zat("0.01")  # 1000000
+        ```
+    """
+    try:
+        value = Decimal(str(amount).strip())
+    except InvalidOperation:
+        raise ValueError(f"Invalid ZEC amount: {amount!r}") from None
+    if not value.is_finite():
+        raise ValueError(f"Invalid ZEC amount: {amount!r}")
+    return int(value * ZAT_PER_ZEC)
+
+
+def zat_to_zec(zat: int) -> Decimal:
+    """Convert integer zatoshis back to a ZEC Decimal"""
+    return Decimal(zat) / _ZAT_PER_ZEC_DECIMAL
@@ -3,10 +3,83 @@
 import hashlib
 import hmac
 import json
+import re
 import time
-from typing import Any, Dict, Union
+import warnings
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Union
 
 from z402.exceptions import WebhookVerificationError
+from z402.utils.serialization import JSONDecodeError, loads
+
+# Signature header as the backend sends it: t=<unix timestamp>,v1=<hex HMAC>
+_SIG_RE = re.compile(r"t=(\d+),v1=([0-9a-f]+)")
+
+
+@lru_cache(maxsize=32)
+def _hmac_template(secret: str) -> "hmac.HMAC":
+    """
+    HMAC-SHA256 object keyed with secret, holding no message data.
+
+    Keying pads the secret and hashes the inner and outer pad blocks; caching
+    the keyed object and copying it per signature skips that setup, leaving
+    only the message itself to hash.
+    """
+    return hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def _sign(secret: str, message: bytes) -> str:
+    """Hex HMAC-SHA256 of message under secret"""
+    mac = _hmac_template(secret).copy()
+    mac.update(message)
+    return mac.hexdigest()
+
+
+def _check_signature(
+    body: bytes,
+    signature: str,
+    template: "hmac.HMAC",
+    tolerance: int,
+) -> None:
+    """Raise WebhookVerificationError unless signature is valid for body"""
+    if not signature:
+        raise WebhookVerificationError("Missing signature header")
+
+    # Parse signature (format: t=timestamp,v1=signature) with one match
+    match = _SIG_RE.fullmatch(signature)
+    if match is None:
+        raise WebhookVerificationError("Invalid signature format")
+
+    timestamp = int(match.group(1))
+    try:
+        provided_signature = bytes.fromhex(match.group(2))
+    except ValueError:
+        # Odd number of hex digits
+        raise WebhookVerificationError("Invalid signature")
+
+    # Check timestamp is within tolerance, in either direction to allow for
+    # clock skew. time_ns() keeps this in ints, with no float round trip
+    now = time.time_ns() // 1_000_000_000
+    if abs(now - timestamp) > tolerance:
+        raise WebhookVerificationError("Signature timestamp too old")
+
+    # Compute expected signature
+    mac = template.copy()
+    mac.update(b"%d." % timestamp + body)
+
+    # Compare raw digests (constant time to prevent timing attacks), which
+    # skips hex-encoding the expected signature
+    if not hmac.compare_digest(mac.digest(), provided_signature):
+        raise WebhookVerificationError("Invalid signature")
+
+
+def _parse_event(body: Union[str, bytes]) -> Dict[str, Any]:
+    """Parse a verified webhook body"""
+    try:
+        event: Dict[str, Any] = loads(body)
+    except (JSONDecodeError, UnicodeDecodeError):
+        raise WebhookVerificationError("Invalid JSON payload")
+    return event
 
 
 def verify_webhook(
@@ -18,8 +91,13 @@ def verify_webhook(
     """
     Verify webhook signature and return parsed event.
 
+    The signature covers the exact bytes the sender transmitted, so pass the
+    raw request body. Passing a parsed dict is deprecated: it has to be
+    re-serialized, which only matches the signature if the key order and
+    spacing happen to agree with the sender's encoding.
+
     Args:
-        payload: Raw request body (string, bytes, or dict)
+        payload: Raw request body as bytes or string (dict is deprecated)
         signature: Signature from z402-signature header
         secret: Your webhook secret
         tolerance: Maximum age of signature in seconds (default: 300)
@@ -45,71 +123,142 @@ def verify_webhook(
                 return {"error": str(e)}, 400
         ```
     """
-    if not signature:
-        raise WebhookVerificationError("Missing signature header")
-
     if not secret:
         raise WebhookVerificationError("Webhook secret not provided")
 
-    # Parse signature (format: t=timestamp,v1=signature)
-    parts = signature.split(",")
-    timestamp_part = next((p for p in parts if p.startswith("t=")), None)
-    signature_part = next((p for p in parts if p.startswith("v1=")), None)
+    # Get the exact bytes that were signed
+    if isinstance(payload, dict):
+        warnings.warn(
+            "Passing a dict to verify_webhook is deprecated; pass the raw request body bytes",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        # Stays on stdlib json: orjson doesn't escape non-ASCII, so it would
+        # produce different bytes and break signatures for such payloads
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    elif isinstance(payload, bytes):
+        body = payload
+    else:
+        body = payload.encode("utf-8")
 
-    if not timestamp_part or not signature_part:
-        raise WebhookVerificationError("Invalid signature format")
+    _check_signature(body, signature, _hmac_template(secret), tolerance)
 
-    timestamp_str = timestamp_part.split("=", 1)[1]
-    provided_signature = signature_part.split("=", 1)[1]
+    # Parse and return event. A dict is already parsed, and a str is parsed
+    # as given rather than decoding the bytes that were just encoded from it
+    if isinstance(payload, dict):
+        return payload
+    return _parse_event(payload)
 
-    # Check timestamp is within tolerance
-    try:
-        timestamp = int(timestamp_str)
-    except ValueError:
-        raise WebhookVerificationError("Invalid timestamp in signature")
 
-    now = int(time.time())
-    if abs(now - timestamp) > tolerance:
-        raise WebhookVerificationError("Signature timestamp too old")
+class WebhookVerifier:
+    """
+    Webhook verifier bound to one secret.
 
-    # Convert payload to string
-    if isinstance(payload, dict):
-        payload_string = json.dumps(payload, separators=(",", ":"))
-    elif isinstance(payload, bytes):
-        payload_string = payload.decode("utf-8")
-    else:
-        payload_string = payload
+    The per-secret setup (checking, encoding and keying the HMAC) happens
+    once at construction, so each call only parses the header and hashes
+    the body. This is the preferred path for high-QPS webhook endpoints.
 
-    # Compute expected signature
-    signed_payload = f"{timestamp}.{payload_string}"
-    expected_signature = hmac.new(
-        secret.encode("utf-8"),
-        signed_payload.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
-
-    # Compare signatures (constant time to prevent timing attacks)
-    if not hmac.compare_digest(expected_signature, provided_signature):
-        raise WebhookVerificationError("Invalid signature")
+    Args:
+        secret: Your webhook secret
+        tolerance: Default maximum age of signature in seconds (default: 300)
 
-    # Parse and return event
-    try:
-        if isinstance(payload, dict):
-            return payload
-        return json.loads(payload_string)
-    except json.JSONDecodeError:
-        raise WebhookVerificationError("Invalid JSON payload")
+    Raises:
+        WebhookVerificationError: If secret is empty
+
+    Example:
+        ```python
+        verifier = WebhookVerifier(webhook_secret)
+
+        @app.post("/webhooks/z402")
+        async def handle_webhook(request: Request):
+            event = verifier.verify(
+                await request.body(), request.headers.get("z402-signature")
+            )
+            ...
+        ```
+    """
+
+    __slots__ = ("_template", "tolerance")
+
+    def __init__(self, secret: str, tolerance: int = 300) -> None:
+        if not secret:
+            raise WebhookVerificationError("Webhook secret not provided")
+
+        self._template = hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+        self.tolerance = tolerance
+
+    def verify(
+        self,
+        payload: Union[str, bytes],
+        signature: str,
+        tolerance: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Verify a webhook delivery and return the parsed event.
+
+        Args:
+            payload: Raw request body as bytes or string
+            signature: Signature from z402-signature header
+            tolerance: Maximum age of signature in seconds (default: the
+                verifier's tolerance)
+
+        Returns:
+            Parsed webhook event
+
+        Raises:
+            WebhookVerificationError: If signature is invalid
+        """
+        body = payload if isinstance(payload, bytes) else payload.encode("utf-8")
+        _check_signature(
+            body,
+            signature,
+            self._template,
+            self.tolerance if tolerance is None else tolerance,
+        )
+        return _parse_event(payload)
+
+
+def make_verifier(
+    secret: str,
+    tolerance: int = 300,
+) -> Callable[[Union[str, bytes], str], Dict[str, Any]]:
+    """
+    Create a webhook verification function bound to one secret.
+
+    Shorthand for `WebhookVerifier(secret, tolerance).verify`.
+
+    Args:
+        secret: Your webhook secret
+        tolerance: Maximum age of signature in seconds (default: 300)
+
+    Returns:
+        Function taking (raw_body, signature) and returning the parsed event
+
+    Raises:
+        WebhookVerificationError: If secret is empty
+
+    Example:
+        ```python
+        verify = make_verifier(webhook_secret)
+
+        @app.post("/webhooks/z402")
+        async def handle_webhook(request: Request):
+            event = verify(await request.body(), request.headers.get("z402-signature"))
+            ...
+        ```
+    """
+    return WebhookVerifier(secret, tolerance).verify
 
 
 def construct_webhook_signature(
-    payload: Union[str, Dict[str, Any]],
+    payload: Union[str, bytes, Dict[str, Any]],
     secret: str,
 ) -> str:
     """
     Construct webhook signature for testing.
 
     Args:
-        payload: Webhook payload (string or dict)
+        payload: Webhook payload (bytes, string, or dict)
         secret: Webhook secret
 
     Returns:
@@ -124,15 +273,12 @@ def construct_webhook_signature(
     timestamp = int(time.time())
 
     if isinstance(payload, dict):
-        payload_string = json.dumps(payload, separators=(",", ":"))
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    elif isinstance(payload, bytes):
+        body = payload
     else:
-        payload_string = payload
-
-    signed_payload = f"{timestamp}.{payload_string}"
-    signature = hmac.new(
-        secret.encode("utf-8"),
-        signed_payload.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
+        body = payload.encode("utf-8")
+
+    signature = _sign(secret, b"%d." % timestamp + body)
 
     return f"t={timestamp},v1={signature}"